@@ -0,0 +1,109 @@
+"""
+Benchmark: bytes transferred and CPU time per video for each download format.
+
+Downloads the same Shorts in every ``shorts_scraper.ytdl.DOWNLOAD_FORMATS``
+entry (into a temp dir) and reports, per video: bytes fetched from the
+network (from yt-dlp's progress hooks), size of the final file, CPU time of
+this process plus its children (the ffmpeg merge for "best") and wall time.
+Needs network access and, for "best", ffmpeg.
+
+    python benchmarks/bench_download_formats.py URL [URL ...] [--urls-file F] \\
+        [--formats best 480p audio]
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import yt_dlp
+
+from shorts_scraper.ytdl import DOWNLOAD_FORMATS, download_opts
+
+
+def cpu_seconds():
+    t = os.times()
+    return t.user + t.system + t.children_user + t.children_system
+
+
+def run(urls, format_name, out_dir):
+    fetched = [0]
+
+    def hook(d):
+        if d["status"] == "finished":
+            fetched[0] += d.get("downloaded_bytes") or d.get("total_bytes") or 0
+
+    ext = DOWNLOAD_FORMATS[format_name]["ext"]
+    opts = {
+        "outtmpl": os.path.join(out_dir, "%(id)s.%(ext)s"),
+        **download_opts(format_name),
+        "quiet": True, "no_warnings": True, "noprogress": True,
+        "progress_hooks": [hook],
+    }
+    ok, file_bytes = 0, 0
+    cpu, wall = cpu_seconds(), time.perf_counter()
+    with yt_dlp.YoutubeDL(opts) as ydl:
+        for url in urls:
+            try:
+                info = ydl.extract_info(url, download=True)
+            except Exception as e:
+                print(f"  {format_name}: {url}: {e}", file=sys.stderr)
+                continue
+            path = os.path.join(out_dir, f"{info['id']}.{ext}")
+            if os.path.exists(path):
+                ok += 1
+                file_bytes += os.path.getsize(path)
+    return {
+        "ok": ok,
+        "fetched": fetched[0],
+        "file": file_bytes,
+        "cpu": cpu_seconds() - cpu,
+        "wall": time.perf_counter() - wall,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("urls", nargs="*", help="Shorts / watch URLs")
+    parser.add_argument("--urls-file", help="file with one URL per line")
+    parser.add_argument("--formats", nargs="+", default=list(DOWNLOAD_FORMATS),
+                        choices=list(DOWNLOAD_FORMATS))
+    args = parser.parse_args()
+
+    urls = list(args.urls)
+    if args.urls_file:
+        with open(args.urls_file, "r", encoding="utf-8") as f:
+            urls += [line.strip() for line in f if line.strip()]
+    if not urls:
+        sys.exit("No URLs given")
+
+    results = {}
+    for format_name in args.formats:
+        with tempfile.TemporaryDirectory() as out_dir:
+            results[format_name] = run(urls, format_name, out_dir)
+
+    baseline = results.get("best")
+    print(f"videos: {len(urls)}\n")
+    print(
+        f"{'format':>12} | {'ok':>4} | {'fetched MB':>10} | {'file MB':>8}"
+        f" | {'CPU s':>6} | {'wall s':>6} | {'bytes vs best':>13}"
+    )
+    print("-" * 78)
+    for format_name, r in results.items():
+        n = max(r["ok"], 1)
+        ratio = ""
+        if baseline and baseline["ok"] and r["ok"]:
+            ratio = f"{(r['fetched'] / r['ok']) / (baseline['fetched'] / baseline['ok']):.1%}"
+        print(
+            f"{format_name:>12} | {r['ok']:>4} | {r['fetched'] / n / 1e6:>10.2f}"
+            f" | {r['file'] / n / 1e6:>8.2f} | {r['cpu'] / n:>6.2f}"
+            f" | {r['wall'] / n:>6.2f} | {ratio:>13}"
+        )
+    print("\n(all figures per successfully downloaded video)")
+
+
+if __name__ == "__main__":
+    main()
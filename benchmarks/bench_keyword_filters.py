@@ -0,0 +1,117 @@
+"""
+Benchmark: keyword filters over a corpus of saved metadata JSON.
+
+Runs every profile's include/exclude filter and category classifier over the
+text blob of each metadata file, once with the per-keyword substring scans
+the filters used to do and once with the compiled ``KeywordMatcher``, checks
+that both give identical results and reports the time per description.
+
+    python benchmarks/bench_keyword_filters.py ~/Desktop/video_crawler_*/metadata \\
+        [--repeat 10]
+"""
+
+import os
+import sys
+import json
+import glob
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from shorts_scraper.keywords import KeywordMatcher
+from shorts_scraper.profiles import PROFILES, load_profile
+
+
+def load_corpus(paths):
+    texts = []
+    for path in paths:
+        files = [path] if os.path.isfile(path) else \
+            glob.glob(os.path.join(path, "**", "*.json"), recursive=True)
+        for file in sorted(files):
+            try:
+                with open(file, "r", encoding="utf-8") as f:
+                    meta = json.load(f)
+            except Exception:
+                continue
+            if not isinstance(meta, dict) or "title" not in meta:
+                continue   # index files and other non-metadata JSON
+            tags = meta.get("tags") or []
+            texts.append(f"{meta.get('title', '')} {meta.get('description') or ''} {' '.join(tags)}")
+    return texts
+
+
+def substring_filters(profile):
+    """The filters as plain ``any(k in t ...)`` scans, one list at a time."""
+    include, exclude = profile.keywords.lists["include"], profile.keywords.lists["exclude"]
+
+    def run(text):
+        t = text.lower()
+        accepted = bool(text) and not any(k in t for k in exclude) and any(k in t for k in include)
+        category = next(
+            (name for name, keywords in profile.category_keywords if any(k in t for k in keywords)),
+            profile.default_category,
+        )
+        return accepted, category
+    return run
+
+
+def matcher_filters(profile):
+    def run(text):
+        matches = profile.keywords.scan(text)
+        return profile.accepts(text, matches), profile.classify_category(text, matches)
+    return run
+
+
+def time_filter(run, texts):
+    start = time.perf_counter()
+    results = [run(text) for text in texts]
+    return results, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("paths", nargs="+", help="metadata JSON files or directories")
+    parser.add_argument("--repeat", type=int, default=1, help="replay the corpus N times")
+    args = parser.parse_args()
+
+    texts = load_corpus(args.paths) * args.repeat
+    if not texts:
+        sys.exit("No metadata JSON found")
+    chars = sum(len(t) for t in texts)
+    print(f"{len(texts):,} descriptions, {chars / len(texts):.0f} chars on average\n")
+
+    profiles = {name: load_profile(name) for name in PROFILES}
+    print(f"{'profile':>16} | {'keywords':>8} | {'substring (µs)':>14} | {'matcher (µs)':>12}")
+    print("-" * 62)
+    totals = [0.0, 0.0]
+    for name, profile in profiles.items():
+        expected, old = time_filter(substring_filters(profile), texts)
+        got, new = time_filter(matcher_filters(profile), texts)
+        mismatches = sum(a != b for a, b in zip(expected, got))
+        if mismatches:
+            sys.exit(f"{name}: {mismatches} results differ from the substring filters")
+        keywords = sum(len(v) for v in profile.keywords.lists.values())
+        print(
+            f"{name:>16} | {keywords:>8} | {old / len(texts) * 1e6:>14.2f}"
+            f" | {new / len(texts) * 1e6:>12.2f}"
+        )
+        totals[0] += old
+        totals[1] += new
+
+    # One matcher over every profile's lists at once (a text scanned once)
+    combined = KeywordMatcher({
+        f"{name}:{lst}": keywords
+        for name, profile in profiles.items() for lst, keywords in profile.keywords.lists.items()
+    })
+    _, combined_time = time_filter(combined.scan, texts)
+    print("-" * 62)
+    print(
+        f"{'all, separately':>16} | {'':>8} | {totals[0] / len(texts) * 1e6:>14.2f}"
+        f" | {totals[1] / len(texts) * 1e6:>12.2f}"
+    )
+    print(f"{'all, one pass':>16} | {'':>8} | {'':>14} | {combined_time / len(texts) * 1e6:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Micro-benchmark: link canonicalisation per discovered href.
+
+Compares the per-call normaliser the tracker used to have (``import re`` and
+two uncompiled searches) with ``normalize_many`` over discovery-sized
+batches of /shorts/ and watch?v= links, and checks both agree.
+
+    python benchmarks/bench_normalize.py [--batch 300] [--repeat 200]
+"""
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from shorts_scraper.tracker import normalize_many
+
+
+def old_normalize(url):
+    import re
+    shorts_match = re.search(r"/shorts/([a-zA-Z0-9_-]+)", url)
+    if shorts_match:
+        return f"https://www.youtube.com/shorts/{shorts_match.group(1)}"
+    watch_match = re.search(r"[?&]v=([a-zA-Z0-9_-]+)", url)
+    if watch_match:
+        return f"https://www.youtube.com/shorts/{watch_match.group(1)}"
+    return url.split("?")[0].split("&")[0]
+
+
+def make_batch(size):
+    """Mostly /shorts/ links, with some watch?v= duplicates, like a search page."""
+    urls = []
+    for i in range(size):
+        video_id = f"vid{i // 2:08d}"
+        if i % 5 == 4:
+            urls.append(f"https://www.youtube.com/watch?v={video_id}&pp=ygUF")
+        else:
+            urls.append(f"https://www.youtube.com/shorts/{video_id}")
+    return urls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--batch", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    urls = make_batch(args.batch)
+    assert [old_normalize(u) for u in urls] == [url for url, _ in normalize_many(urls)]
+
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        set(old_normalize(u) for u in urls)
+    old = (time.perf_counter() - start) / (args.repeat * len(urls)) * 1e6
+
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        dict(normalize_many(urls))
+    new = (time.perf_counter() - start) / (args.repeat * len(urls)) * 1e6
+
+    unique = len(dict(normalize_many(urls)))
+    print(f"{len(urls)} links per batch, {unique} unique videos")
+    print(f"  per-call re.search : {old:6.2f} µs/link")
+    print(f"  normalize_many     : {new:6.2f} µs/link  ({old / new:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
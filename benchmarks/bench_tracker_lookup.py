@@ -0,0 +1,87 @@
+"""
+Micro-benchmark: DuplicateTracker.is_duplicate latency vs. index size.
+
+Lookups by URL and by video_id should stay flat from 1k to 1M entries. The
+last column is VideoStore.is_duplicate by URL, where the Bloom filter answers
+the misses and only the hits reach SQLite.
+
+    python benchmarks/bench_tracker_lookup.py [--sizes 1000 10000 100000 1000000]
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from shorts_scraper.store import VideoStore
+from shorts_scraper.tracker import DuplicateTracker, IndexEntry
+
+LOOKUPS = 100_000
+
+
+def build_tracker(tmp_dir, size):
+    """Return a tracker holding ``size`` synthetic entries (no disk I/O)."""
+    tracker = DuplicateTracker(os.path.join(tmp_dir, f"index_{size}.json"))
+    for i in range(size):
+        url = f"https://www.youtube.com/shorts/vid{i:011d}"
+        video_id = f"youtube_vid{i:011d}"
+        tracker.scraped_videos[url] = IndexEntry(video_id, 20250101000000)
+    return tracker
+
+
+def build_store(tmp_dir, size):
+    """Return a VideoStore holding ``size`` synthetic rows."""
+    db_path = os.path.join(tmp_dir, f"videos_{size}.db")
+    store = VideoStore(db_path)
+    with store._lock:
+        store.conn.execute("BEGIN")
+        store.conn.executemany(
+            "INSERT INTO videos (video_id, url) VALUES (?, ?)",
+            (
+                (f"vid{i:011d}", f"https://www.youtube.com/shorts/vid{i:011d}")
+                for i in range(size)
+            ),
+        )
+        store.conn.execute("COMMIT")
+    store.close()
+    return VideoStore(db_path)   # reopening reads the new rows into the filter
+
+
+def time_lookups(tracker, size, by_id):
+    probes = []
+    for i in range(LOOKUPS):
+        n = (i * 7919) % (size * 2)   # half hits, half misses
+        url = f"https://www.youtube.com/watch?v=other{n:011d}" if by_id else \
+            f"https://www.youtube.com/shorts/vid{n:011d}"
+        probes.append((url, f"youtube_vid{n:011d}" if by_id else None))
+    start = time.perf_counter()
+    for url, video_id in probes:
+        tracker.is_duplicate(url, video_id)
+    return (time.perf_counter() - start) / LOOKUPS * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+",
+                        default=[1_000, 10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+
+    print(f"{'entries':>10} | {'by url (µs)':>12} | {'by video_id (µs)':>16} | {'sqlite (µs)':>11}")
+    print("-" * 60)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for size in args.sizes:
+            tracker = build_tracker(tmp_dir, size)
+            by_url = time_lookups(tracker, size, by_id=False)
+            by_id = time_lookups(tracker, size, by_id=True)
+            del tracker
+            store = build_store(tmp_dir, size)
+            sqlite = time_lookups(store, size, by_id=False)
+            store.close()
+            print(f"{size:>10,} | {by_url:>12.2f} | {by_id:>16.2f} | {sqlite:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Benchmark: DuplicateTracker index memory and get_stats time vs. index size.
+
+Builds the same synthetic index twice: as the dict-of-dicts entries the
+tracker used to keep, and as ``IndexEntry`` records the way ``_load_index``
+builds them (one parsed dict per entry, converted as it is read). Every
+string is a fresh object, as after ``json.load``. Reports the traced memory
+per entry and the time of one ``get_stats`` call: the old min/max walk over
+every entry against the tracker's incrementally kept bounds.
+
+    python benchmarks/bench_tracker_memory.py [--sizes 100000 1000000] [--channels 5000]
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from shorts_scraper.tracker import DuplicateTracker, IndexEntry
+
+
+def parsed_entries(size, channels):
+    """Yield ``(url, entry_dict)`` with freshly built strings, like ``json.load``."""
+    for i in range(size):
+        channel = "".join(["Channel ", str(i % channels)])
+        yield "".join(["https://www.youtube.com/shorts/vid", f"{i:08d}"]), {
+            "video_id": "".join(["youtube_vid", f"{i:08d}"]),
+            "scraped_at": f"2025-{1 + i % 12:02d}-{1 + i % 28:02d} {i % 24:02d}:{i % 60:02d}:00",
+            "title": f"How to stack sats #{i} - daily crypto tips",
+            "uploader": channel,
+            "channel": "".join(["Channel ", str(i % channels)]),
+        }
+
+
+def measure(build):
+    tracemalloc.start()
+    start = time.perf_counter()
+    index = build()
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return index, current, elapsed
+
+
+def old_stats(index):
+    return {
+        "total_scraped": len(index),
+        "oldest": min((v["scraped_at"] for v in index.values()), default=None),
+        "newest": max((v["scraped_at"] for v in index.values()), default=None),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--channels", type=int, default=5_000,
+                        help="distinct channels the entries are spread over")
+    args = parser.parse_args()
+
+    print(f"{'entries':>10} | {'dicts (B/entry)':>15} | {'records (B/entry)':>17} | "
+          f"{'stats old (ms)':>14} | {'stats new (ms)':>14}")
+    print("-" * 84)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for size in args.sizes:
+            old, old_bytes, _ = measure(lambda: dict(parsed_entries(size, args.channels)))
+            start = time.perf_counter()
+            expected = old_stats(old)
+            old_ms = (time.perf_counter() - start) * 1e3
+            del old
+
+            tracker = DuplicateTracker(os.path.join(tmp_dir, f"index_{size}.json"))
+
+            def build():
+                index = tracker.scraped_videos
+                for url, entry in parsed_entries(size, args.channels):
+                    index[url] = IndexEntry.from_dict(entry)
+                return index
+
+            _, new_bytes, _ = measure(build)
+            tracker._reset_bounds(tracker.scraped_videos.values())   # as _load_index does
+            start = time.perf_counter()
+            stats = tracker.get_stats()
+            new_ms = (time.perf_counter() - start) * 1e3
+            assert stats == expected, (stats, expected)
+            del tracker
+
+            print(f"{size:>10,} | {old_bytes / size:>15.0f} | {new_bytes / size:>17.0f} | "
+                  f"{old_ms:>14.2f} | {new_ms:>14.4f}")
+
+
+if __name__ == "__main__":
+    main()
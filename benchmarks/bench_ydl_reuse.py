@@ -0,0 +1,89 @@
+"""
+Benchmark: per-video overhead of a fresh yt_dlp.YoutubeDL vs. a reused one.
+
+A local HTTP server stands in for YouTube and serves a small fake mp4 at
+/v/<n>.mp4, so yt-dlp's generic extractor handles each URL without touching
+the network. Each mode extracts metadata for (and optionally downloads) the
+same set of URLs; the difference per video is the construction overhead that
+shorts_scraper.ytdl.get_ydl saves.
+
+    python benchmarks/bench_ydl_reuse.py [--videos 200] [--download]
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import yt_dlp
+
+from shorts_scraper import ytdl
+
+PAYLOAD = b"\x00\x00\x00\x18ftypmp42" + b"\x00" * 64 * 1024
+
+
+class FakeVideoHandler(BaseHTTPRequestHandler):
+    def _headers(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "video/mp4")
+        self.send_header("Content-Length", str(len(PAYLOAD)))
+        self.end_headers()
+
+    def do_HEAD(self):
+        self._headers()
+
+    def do_GET(self):
+        self._headers()
+        self.wfile.write(PAYLOAD)
+
+    def log_message(self, *args):
+        pass
+
+
+def run(urls, opts, reuse):
+    start = time.perf_counter()
+    for url in urls:
+        if reuse:
+            ydl = ytdl.get_ydl("bench", opts)
+            ydl.extract_info(url, download=not opts.get("skip_download"))
+        else:
+            with yt_dlp.YoutubeDL(dict(opts)) as ydl:
+                ydl.extract_info(url, download=not opts.get("skip_download"))
+    return (time.perf_counter() - start) / len(urls) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--videos", type=int, default=200)
+    parser.add_argument("--download", action="store_true",
+                        help="also download each fake video to a temp dir")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeVideoHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}/v"
+    urls = [f"{base}/{n}.mp4" for n in range(args.videos)]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        opts = {"quiet": True, "no_warnings": True, "noprogress": True,
+                "skip_download": not args.download,
+                "outtmpl": os.path.join(tmp_dir, "%(id)s.%(ext)s"), "overwrites": True}
+        run(urls[:5], opts, reuse=False)          # warm imports / extractor lazy-load
+        fresh = run(urls, opts, reuse=False)
+        reused = run(urls, opts, reuse=True)
+        ytdl.close_all()
+    server.shutdown()
+
+    print(f"videos:             {args.videos}")
+    print(f"fresh YoutubeDL:    {fresh:8.2f} ms/video")
+    print(f"reused YoutubeDL:   {reused:8.2f} ms/video")
+    print(f"overhead saved:     {fresh - reused:8.2f} ms/video ({(1 - reused / fresh):.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,7 @@
+"""
+Shared building blocks for the YouTube Shorts dataset scrapers.
+"""
+
+from shorts_scraper.tracker import DuplicateTracker
+
+__all__ = ["DuplicateTracker"]
@@ -0,0 +1,109 @@
+"""
+Bloom filter used as the membership layer in front of the video database.
+
+A Bloom filter answers "definitely not seen" or "maybe seen" for a key in
+about 1.2 bytes per key at a 1% false-positive rate, whatever the key
+length. Nearly every link the crawler looks at is new, so checking the
+filter first means only the "maybe" answers reach the database.
+
+The filter is saved next to what it summarises as a small header followed by
+the bit array. The header carries a caller-defined ``stamp`` (e.g. the last
+row id covered) so the owner can tell how far the saved filter is behind.
+"""
+
+import os
+import math
+import struct
+import hashlib
+
+ERROR_RATE = 0.01         # false-positive rate at full capacity
+MIN_CAPACITY = 100_000    # smallest filter allocated (~120 KB)
+
+_MAGIC = b"SSBF"
+_HEADER = struct.Struct("<4sQQBQQ")   # magic, capacity, bits, hashes, count, stamp
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings.
+
+    ``capacity`` is the number of keys the filter holds at ``error_rate``;
+    past that the false-positive rate climbs, so owners rebuild a larger
+    filter once ``full()``.
+    """
+
+    def __init__(self, capacity, error_rate=ERROR_RATE):
+        self.capacity = max(MIN_CAPACITY, int(capacity))
+        self.num_bits = math.ceil(-self.capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.num_hashes = max(1, round(self.num_bits / self.capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _hashes(self, key):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        return int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+
+    def add(self, key):
+        h1, h2 = self._hashes(key)
+        bits, m = self.bits, self.num_bits
+        for i in range(self.num_hashes):
+            pos = (h1 + i * h2) % m
+            bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key):
+        h1, h2 = self._hashes(key)
+        bits, m = self.bits, self.num_bits
+        for i in range(self.num_hashes):   # a miss usually stops at the first probe
+            pos = (h1 + i * h2) % m
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+    def __len__(self):
+        return self.count
+
+    def full(self):
+        return self.count >= self.capacity
+
+    # ----------------------------------------------
+    # Persistence
+    # ----------------------------------------------
+    def save(self, path, stamp=0):
+        """Atomically write the filter to ``path``; return True on success."""
+        tmp_path = path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(_HEADER.pack(
+                    _MAGIC, self.capacity, self.num_bits, self.num_hashes, self.count, stamp
+                ))
+                f.write(self.bits)
+            os.replace(tmp_path, path)
+            return True
+        except Exception as e:
+            print(f"⚠ Error saving membership filter: {e}")
+            return False
+
+    @classmethod
+    def load(cls, path):
+        """Return ``(filter, stamp)`` from ``path``, or ``(None, None)`` if unusable."""
+        if not os.path.exists(path):
+            return None, None
+        try:
+            with open(path, "rb") as f:
+                header = f.read(_HEADER.size)
+                magic, capacity, num_bits, num_hashes, count, stamp = _HEADER.unpack(header)
+                bits = bytearray(f.read())
+        except Exception as e:
+            print(f"⚠ Error loading membership filter, rebuilding: {e}")
+            return None, None
+        if magic != _MAGIC or len(bits) != (num_bits + 7) // 8 or not num_hashes:
+            print("⚠ Membership filter file is damaged, rebuilding")
+            return None, None
+        bloom = cls.__new__(cls)
+        bloom.capacity = capacity
+        bloom.num_bits = num_bits
+        bloom.num_hashes = num_hashes
+        bloom.bits = bits
+        bloom.count = count
+        return bloom, stamp
@@ -0,0 +1,123 @@
+"""
+Pool of browser sessions for page discovery.
+
+Each worker thread owns one Chrome session with its own throwaway profile
+directory, takes pages from a shared task queue and streams
+``(page, found, error)`` results back to the crawler. A session that dies
+(crashed renderer, lost driver connection) is quit and relaunched, and the
+page is retried once on the fresh session.
+"""
+
+import queue
+import shutil
+import time
+import tempfile
+import threading
+
+DISCOVERY_RETRIES = 1     # extra attempts for a page after a session restart
+
+
+def _session_alive(driver):
+    try:
+        driver.execute_script("return 1")
+        return True
+    except Exception:
+        return False
+
+
+class DiscoveryPool:
+    """Runs ``discover(driver, page)`` for submitted pages on ``sessions`` browsers."""
+
+    def __init__(self, make_driver, discover, sessions=2):
+        self.make_driver = make_driver
+        self.discover = discover
+        self.sessions = sessions
+        self.in_flight = 0
+        self.restarts = 0
+        self.launch_seconds = []   # wall time of each driver + Chrome launch
+        self._tasks = queue.Queue()
+        self._results = queue.Queue()
+        # Chrome launches (and driver resolution) are serialized
+        self._launch_lock = threading.Lock()
+        self._threads = [
+            threading.Thread(
+                target=self._worker, args=(n,), name=f"discovery-{n}", daemon=True
+            )
+            for n in range(sessions)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, page):
+        self.in_flight += 1
+        self._tasks.put(page)
+
+    def next_result(self):
+        """Block until a page finishes; return ``(page, found, error)``."""
+        result = self._results.get()
+        self.in_flight -= 1
+        return result
+
+    def close(self):
+        """Drop pages not yet started, then quit every session."""
+        while True:
+            try:
+                self._tasks.get_nowait()
+            except queue.Empty:
+                break
+        for _ in self._threads:
+            self._tasks.put(None)
+        for thread in self._threads:
+            thread.join()
+
+    # ----------------------------------------------
+    # Worker side
+    # ----------------------------------------------
+    def _launch(self, n):
+        profile_dir = tempfile.mkdtemp(prefix=f"shorts-discovery-{n}-")
+        try:
+            with self._launch_lock:
+                start = time.perf_counter()
+                driver = self.make_driver(profile_dir)
+                self.launch_seconds.append(time.perf_counter() - start)
+                return driver, profile_dir
+        except Exception:
+            shutil.rmtree(profile_dir, ignore_errors=True)
+            raise
+
+    @staticmethod
+    def _quit(driver, profile_dir):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        shutil.rmtree(profile_dir, ignore_errors=True)
+
+    def _worker(self, n):
+        driver = profile_dir = None
+        try:
+            while True:
+                page = self._tasks.get()
+                if page is None:
+                    break
+                found, error = None, None
+                for attempt in range(DISCOVERY_RETRIES + 1):
+                    try:
+                        if driver is None:
+                            driver, profile_dir = self._launch(n)
+                        found, error = self.discover(driver, page), None
+                        break
+                    except Exception as e:
+                        error = e
+                        if driver is not None and _session_alive(driver):
+                            break
+                        # Session is gone: relaunch and retry the page
+                        if driver is not None:
+                            print(f"  ⚠ Browser session {n} died ({e}); restarting")
+                            self._quit(driver, profile_dir)
+                            driver = profile_dir = None
+                            self.restarts += 1
+                self._results.put((page, found, error))
+        finally:
+            if driver is not None:
+                self._quit(driver, profile_dir)
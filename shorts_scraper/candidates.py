@@ -0,0 +1,114 @@
+"""
+Structured discovery candidates and the per-stage rejection funnel.
+
+Search and channel pages already render each Short's title and an abbreviated
+view count ("1.2K views"). ``CARD_SCRIPT`` collects them along with the link,
+so cheap checks can run before a video costs a yt-dlp call.
+"""
+
+import re
+from collections import Counter
+
+from shorts_scraper.tracker import normalize_many
+
+LINK_SELECTOR = (
+    "a#video-title, a.ytd-thumbnail, a.shortsLockupViewModelHostEndpoint, a.reel-item-endpoint"
+)
+
+# Returns [{href, title, views}] for every Short / video card on the page
+CARD_SCRIPT = """
+    const anchors = document.querySelectorAll('""" + LINK_SELECTOR + """');
+    const cards = [];
+    for (const a of anchors) {
+        const href = a.href;
+        if (!href || !(href.includes('shorts/') || href.includes('watch?v='))) continue;
+        const card = a.closest(
+            'ytd-video-renderer, ytd-rich-item-renderer, ytd-reel-item-renderer,'
+            + ' ytm-shorts-lockup-view-model, ytm-shorts-lockup-view-model-v2'
+        ) || a.parentElement;
+        const titleEl = card.querySelector('#video-title, h3');
+        const title = (a.getAttribute('title') || (titleEl && titleEl.textContent) || '').trim();
+        const text = (a.getAttribute('aria-label') || '') + ' ' + (card.innerText || '');
+        const views = (text.match(/([\\d.,]+\\s*[KMB]?)\\s*views/i) || [])[1] || null;
+        cards.push({href: href, title: title, views: views});
+    }
+    return cards;
+"""
+
+_VIEWS = re.compile(r"([\d.,]+)\s*([KMB]?)", re.IGNORECASE)
+_MULTIPLIERS = {"": 1, "K": 1_000, "M": 1_000_000, "B": 1_000_000_000}
+
+
+def max_view_count(text):
+    """Upper bound on the true view count behind a label like ``1.2K``.
+
+    YouTube truncates abbreviated counts ("1,299" shows as "1.2K"), so only
+    the bound is safe to compare against a minimum.
+    """
+    if not text:
+        return None
+    match = _VIEWS.search(text)
+    if not match:
+        return None
+    number, suffix = match.group(1), match.group(2).upper()
+    if not suffix:
+        digits = number.replace(",", "").replace(".", "")
+        return int(digits) if digits else None
+    try:
+        value = float(number.replace(",", ""))
+    except ValueError:
+        return None
+    decimals = len(number.split(".")[1]) if "." in number else 0
+    return int((value + 10 ** -decimals) * _MULTIPLIERS[suffix]) - 1
+
+
+def build_candidates(cards):
+    """Merge raw ``CARD_SCRIPT`` rows into one candidate dict per video.
+
+    Links are keyed by video id, so ``/shorts/ID`` and ``watch?v=ID`` cards
+    of the same video merge, and their URL becomes the canonical
+    ``/shorts/ID`` form. Links without a recognisable id are kept without
+    their query string.
+    """
+    cards = [card for card in cards if card.get("href")]
+    by_url = {}
+    for card, (url, video_id) in zip(cards, normalize_many(card["href"] for card in cards)):
+        candidate = by_url.get(url)
+        if candidate is None:
+            candidate = by_url[url] = {
+                "url": url, "video_id": video_id, "title": "", "max_views": None,
+            }
+        if not candidate["title"] and card.get("title"):
+            candidate["title"] = card["title"]
+        if candidate["max_views"] is None:
+            candidate["max_views"] = max_view_count(card.get("views"))
+    return list(by_url.values())
+
+
+class Funnel:
+    """Counts candidates entering each pipeline stage and why they were rejected."""
+
+    def __init__(self, stages):
+        self.stages = list(stages)
+        self.entered = Counter()
+        self.rejected = {stage: Counter() for stage in self.stages}
+
+    def enter(self, stage, n=1):
+        self.entered[stage] += n
+
+    def reject(self, stage, reason, n=1):
+        self.rejected[stage][reason] += n
+
+    def report(self):
+        print("  Rejection rate per stage:")
+        for stage in self.stages:
+            entered = self.entered[stage]
+            rejected = sum(self.rejected[stage].values())
+            rate = rejected / entered if entered else 0.0
+            reasons = ", ".join(
+                f"{reason} {count}" for reason, count in self.rejected[stage].most_common()
+            )
+            print(
+                f"    {stage:<12} {entered:>6} in | {rejected:>6} rejected ({rate:6.1%})"
+                + (f"  [{reasons}]" if reasons else "")
+            )
@@ -0,0 +1,94 @@
+"""
+Channel registry for channel expansion.
+
+After an accepted video the engine crawls its channel's Shorts page. The
+registry keys channels by YouTube channel id (not the display name, which is
+neither unique nor a valid handle) and remembers, per dataset:
+
+* when the channel's page was last queued, so it is queued at most once per
+  ``ttl`` (its listing itself is kept in the page cache under that URL). The
+  crawl is shared by all running profiles, so the engine checks this against
+  every running profile's registry;
+* how many of the channel's videos were fetched and how many accepted.
+
+A channel with enough history is "clearly" one or the other: at or below
+``skip_rate`` its page is no longer crawled; at or above ``accept_rate`` the
+engine may accept its videos without an include keyword.
+
+Entries are appended to a JSON-lines file (``journal.AppendLog``); the last
+entry per channel wins.
+"""
+
+import time
+import threading
+
+from shorts_scraper.journal import AppendLog
+
+
+class ChannelRegistry:
+    """Per-channel queue times and acceptance counts for one dataset."""
+
+    def __init__(self, path, ttl, min_fetched=5, skip_rate=0.1, accept_rate=0.9):
+        self.path = path
+        self.ttl = ttl
+        self.min_fetched = min_fetched
+        self.skip_rate = skip_rate
+        self.accept_rate = accept_rate
+        self._lock = threading.Lock()
+        self.channels = {}   # channel id -> {"name", "url", "queued_at", "fetched", "accepted"}
+        self._log = AppendLog(path, "channel registry")
+        for entry in self._log.records():
+            self.channels[entry.pop("id")] = entry
+        self._log.rewrite(
+            {"id": channel_id, **entry} for channel_id, entry in self.channels.items()
+        )
+
+    def _entry(self, channel):
+        entry = self.channels.get(channel["id"])
+        if entry is None:
+            entry = self.channels[channel["id"]] = {
+                "name": channel.get("name"), "url": channel["url"],
+                "queued_at": None, "fetched": 0, "accepted": 0,
+            }
+        return entry
+
+    def _save(self, channel_id, entry):
+        self._log.append({"id": channel_id, **entry})
+
+    def record(self, channel, accepted):
+        """Count one fetched video of ``channel`` (``{"id", "name", "url"}``)."""
+        with self._lock:
+            entry = self._entry(channel)
+            entry["fetched"] += 1
+            entry["accepted"] += bool(accepted)
+            self._save(channel["id"], entry)
+
+    def verdict(self, channel_id):
+        """Return "accept" or "skip" for a clearly in- or out-of-class channel, else None."""
+        entry = self.channels.get(channel_id)
+        if entry is None or entry["fetched"] < self.min_fetched:
+            return None
+        rate = entry["accepted"] / entry["fetched"]
+        if rate >= self.accept_rate:
+            return "accept"
+        if rate <= self.skip_rate:
+            return "skip"
+        return None
+
+    def queued_recently(self, channel_id, now=None):
+        """True if the channel's page was queued within the TTL."""
+        entry = self.channels.get(channel_id)
+        if entry is None or entry["queued_at"] is None:
+            return False
+        now = time.time() if now is None else now
+        return now - entry["queued_at"] < self.ttl
+
+    def mark_queued(self, channel):
+        with self._lock:
+            entry = self._entry(channel)
+            entry["queued_at"] = int(time.time())
+            self._save(channel["id"], entry)
+
+    def close(self):
+        with self._lock:
+            self._log.close()
@@ -0,0 +1,115 @@
+"""
+ChromeDriver resolution without a network round trip.
+
+``ChromeDriverManager().install()`` detects the Chrome version and checks its
+own cache on every launch, and fails outright when offline. ``driver_path``
+instead looks the installed Chrome version up in a small JSON cache
+(version -> driver path) and only falls back to webdriver-manager when that
+version has never been resolved, or the cached binary has gone missing. A
+pre-provisioned driver (``local_driver`` or ``$CHROMEDRIVER_PATH``) skips
+both.
+"""
+
+import os
+import re
+import json
+import time
+import shutil
+import threading
+import subprocess
+
+CACHE_FILE = os.path.join(
+    os.path.expanduser("~"), ".cache", "shorts_scraper", "chromedriver.json"
+)
+
+_CHROME_BINARIES = [
+    "google-chrome", "google-chrome-stable", "chromium", "chromium-browser",
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+]
+# Windows keeps the installed version in the registry
+_WINDOWS_VERSION_KEYS = [
+    r"HKEY_CURRENT_USER\Software\Google\Chrome\BLBeacon",
+    r"HKEY_LOCAL_MACHINE\Software\Google\Chrome\BLBeacon",
+]
+_VERSION = re.compile(r"(\d+\.\d+\.\d+\.\d+)")
+
+_lock = threading.Lock()
+_resolved = {}            # process-wide memo: (local_driver, cache_file) -> path
+resolve_seconds = 0.0     # time spent in driver_path, for the run summary
+
+
+def chrome_version():
+    """Return the installed Chrome version string, or None if it can't be read."""
+    if os.name == "nt":
+        commands = [["reg", "query", key, "/v", "version"] for key in _WINDOWS_VERSION_KEYS]
+    else:
+        commands = [
+            [binary, "--version"] for binary in _CHROME_BINARIES
+            if os.path.isabs(binary) or shutil.which(binary)
+        ]
+    for command in commands:
+        try:
+            output = subprocess.run(
+                command, capture_output=True, text=True, timeout=5
+            ).stdout
+        except Exception:
+            continue
+        match = _VERSION.search(output or "")
+        if match:
+            return match.group(1)
+    return None
+
+
+def _load_cache(cache_file):
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+
+def _save_cache(cache_file, cache):
+    tmp_path = cache_file + ".tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_file) or ".", exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(cache, f, indent=2)
+        os.replace(tmp_path, cache_file)
+    except Exception as e:
+        print(f"⚠ Error saving ChromeDriver cache: {e}")
+
+
+def _resolve(local_driver, cache_file):
+    local_driver = local_driver or os.environ.get("CHROMEDRIVER_PATH")
+    if local_driver:
+        if not os.path.exists(local_driver):
+            raise FileNotFoundError(f"ChromeDriver not found: {local_driver}")
+        return local_driver
+
+    version = chrome_version()
+    cache = _load_cache(cache_file)
+    cached = cache.get(version) if version else None
+    if cached and os.path.exists(cached):
+        return cached
+
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    path = ChromeDriverManager().install()
+    if version:
+        cache[version] = path
+        _save_cache(cache_file, cache)
+        print(f"✓ Cached ChromeDriver for Chrome {version}: {path}")
+    return path
+
+
+def driver_path(local_driver=None, cache_file=CACHE_FILE):
+    """Return a ChromeDriver path for the installed Chrome, resolving it once per process."""
+    global resolve_seconds
+    key = (local_driver, cache_file)
+    with _lock:
+        path = _resolved.get(key)
+        if path is None:
+            start = time.perf_counter()
+            path = _resolved[key] = _resolve(local_driver, cache_file)
+            resolve_seconds += time.perf_counter() - start
+    return path
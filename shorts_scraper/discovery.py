@@ -0,0 +1,83 @@
+"""
+State-driven scrolling for search and channel Shorts pages.
+
+Instead of fixed sleeps, each scroll waits until the page's video-link count
+or scroll height changes (up to a timeout), and scrolling stops once several
+rounds in a row add no new links or the page holds enough links the caller
+has not seen before.
+"""
+
+import time
+
+from shorts_scraper.candidates import LINK_SELECTOR
+
+POLL_INTERVAL = 0.25      # seconds between page-state checks
+LOAD_TIMEOUT = 10.0       # seconds to wait for the first results after driver.get
+
+# Returns [unique video links on the page, document scroll height]
+PAGE_STATE_SCRIPT = """
+    const hrefs = new Set();
+    for (const a of document.querySelectorAll('""" + LINK_SELECTOR + """')) {
+        const h = a.href;
+        if (h && (h.includes('shorts/') || h.includes('watch?v='))) hrefs.add(h);
+    }
+    return [hrefs.size, document.documentElement.scrollHeight];
+"""
+
+
+# Returns the unique video links on the page
+LINKS_SCRIPT = """
+    const hrefs = new Set();
+    for (const a of document.querySelectorAll('""" + LINK_SELECTOR + """')) {
+        const h = a.href;
+        if (h && (h.includes('shorts/') || h.includes('watch?v='))) hrefs.add(h);
+    }
+    return [...hrefs];
+"""
+
+
+def page_state(driver):
+    links, height = driver.execute_script(PAGE_STATE_SCRIPT)
+    return links, height
+
+
+def wait_for(driver, done, timeout, poll=POLL_INTERVAL):
+    """Poll ``page_state`` until ``done(state)`` or ``timeout``; return the last state."""
+    deadline = time.monotonic() + timeout
+    state = page_state(driver)
+    while not done(state) and time.monotonic() < deadline:
+        time.sleep(poll)
+        state = page_state(driver)
+    return state
+
+
+def enough_new(driver, state, wanted, count_new):
+    """True if ``count_new(hrefs)`` finds at least ``wanted`` new links on the page."""
+    if not wanted or count_new is None or state[0] < wanted:
+        return False
+    return count_new(driver.execute_script(LINKS_SCRIPT)) >= wanted
+
+
+def scroll_results(driver, max_rounds, stale_rounds, timeout, wanted=None, count_new=None):
+    """Scroll the loaded page until it stops producing links; return the link count.
+
+    ``count_new(hrefs)`` optionally returns how many of the page's links are
+    new to the caller; scrolling then also stops once that reaches ``wanted``.
+    """
+    state = wait_for(driver, lambda s: s[0] > 0, LOAD_TIMEOUT)
+    stale = 0
+    for i in range(max_rounds):
+        if enough_new(driver, state, wanted, count_new):
+            print(f"  {state[0]} videos on page — enough new ones for the remaining target")
+            break
+        before = state
+        driver.execute_script(
+            "window.scrollBy(0, document.documentElement.scrollHeight);"
+        )
+        state = wait_for(driver, lambda s: s != before, timeout)
+        stale = stale + 1 if state[0] <= before[0] else 0
+        print(f"  Scroll {i + 1}/{max_rounds}: {state[0]} videos")
+        if stale >= stale_rounds:
+            print(f"  No new videos in {stale} scrolls — stopping")
+            break
+    return state[0]
@@ -0,0 +1,195 @@
+"""
+Background download stage for the scraper engine.
+
+Accepted videos are queued instead of downloaded inline, so a slow
+``bestvideo+bestaudio`` download and ffmpeg merge no longer hold up discovery
+and metadata. ``DownloadQueue`` runs a fixed number of download threads
+behind a bounded queue: when the queue is full, the crawler blocks on
+``submit`` rather than letting the backlog grow without limit. Downloads
+left over from an earlier run go through ``resume``, which feeds them in
+from its own thread so a long backlog does not hold up the crawl.
+
+Every queued download is first recorded as pending in its dataset's download
+state and cleared once the file is on disk, so a restarted run picks up
+whatever the previous one left behind:
+
+* ``StoreDownloads`` keeps that state in a ``VideoStore`` (the ``downloaded`` /
+  ``download_path`` columns);
+* ``DownloadLedger`` keeps it in a JSON-lines journal next to the JSON index.
+"""
+
+import queue
+import threading
+
+from shorts_scraper.journal import AppendLog
+
+
+class DownloadLedger:
+    """Pending downloads of one dataset, journaled to a JSON-lines file."""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._pending = {}   # video_id -> url
+        self._log = AppendLog(path, "download queue")
+        for record in self._log.records():
+            if record.get("done"):
+                self._pending.pop(record["video_id"], None)
+            else:
+                self._pending[record["video_id"]] = record["url"]
+        # Start from a compact journal holding only what is still pending
+        self._log.rewrite(
+            {"video_id": video_id, "url": url} for video_id, url in self._pending.items()
+        )
+
+    def add(self, video_id, url):
+        with self._lock:
+            if video_id not in self._pending:
+                self._pending[video_id] = url
+                self._log.append({"video_id": video_id, "url": url})
+
+    def done(self, video_id, path):
+        with self._lock:
+            if self._pending.pop(video_id, None) is not None:
+                self._log.append({"video_id": video_id, "done": True})
+
+    def pending(self):
+        with self._lock:
+            return list(self._pending.items())
+
+    def close(self):
+        with self._lock:
+            self._log.close()
+
+
+class StoreDownloads:
+    """Pending downloads of one dataset, read from a ``VideoStore``."""
+
+    def __init__(self, store, dataset):
+        self.store = store
+        self.dataset = dataset
+
+    def add(self, video_id, url):
+        pass   # the saved row already has downloaded = 0
+
+    def done(self, video_id, path):
+        self.store.mark_downloaded(video_id, path)
+
+    def pending(self):
+        return [
+            (f"youtube_{video_id}", url)
+            for video_id, url in self.store.pending_downloads(self.dataset)
+        ]
+
+    def close(self):
+        pass   # the store is closed with the duplicate index
+
+
+class DownloadQueue:
+    """Runs ``download(url, video_id, target, source)`` jobs on worker threads.
+
+    A job is one video and the list of targets (datasets) it should end up
+    in; the file is fetched for the first target and passed as ``source`` to
+    the others, so ``download`` can link it instead of fetching it again.
+    ``download`` returns the file path, or None on failure.
+    """
+
+    def __init__(self, download, workers=2, max_pending=20):
+        self.download = download
+        self.downloaded = 0
+        self.failed = 0
+        self._jobs = queue.Queue(maxsize=max_pending)
+        self._count_lock = threading.Lock()
+        self._closed = False
+        self._feeder = None
+        self._unfed = 0                        # resumed jobs not queued yet
+        self._stop_feeding = threading.Event()
+        self._threads = [
+            threading.Thread(target=self._worker, name=f"download-{n}", daemon=True)
+            for n in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, url, video_id, targets):
+        """Queue a video for ``targets``; blocks while the queue is full.
+
+        ``targets`` is a list of ``(target, state)`` pairs; the download is
+        recorded as pending in each ``state`` before it is queued.
+        """
+        for _, state in targets:
+            state.add(video_id, url)
+        self._jobs.put((url, video_id, targets))
+
+    def resume(self, jobs):
+        """Queue ``(url, video_id, targets)`` jobs already pending in their states.
+
+        They are fed in from a background thread as the queue frees up, so
+        the caller does not block on a backlog longer than the queue.
+        """
+        jobs = list(jobs)
+        self._unfed = len(jobs)
+        self._feeder = threading.Thread(
+            target=self._feed, args=(jobs,), name="download-resume", daemon=True
+        )
+        self._feeder.start()
+
+    def backlog(self):
+        return self._jobs.qsize() + self._unfed
+
+    def _drain(self):
+        while True:
+            try:
+                self._jobs.get_nowait()
+            except queue.Empty:
+                break
+
+    def close(self, wait=True):
+        """Stop the workers; with ``wait`` finish the queued jobs first.
+
+        Jobs dropped here stay pending in their download state and are
+        resumed by the next run.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if not wait:
+            self._stop_feeding.set()
+            self._drain()   # frees the feeder if it is blocked on a full queue
+        if self._feeder is not None:
+            self._feeder.join()
+        if not wait:
+            self._drain()
+        for _ in self._threads:
+            self._jobs.put(None)
+        for thread in self._threads:
+            thread.join()
+
+    def _feed(self, jobs):
+        for job in jobs:
+            if self._stop_feeding.is_set():
+                break
+            self._jobs.put(job)
+            self._unfed -= 1
+
+    def _worker(self):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                break
+            url, video_id, targets = job
+            source = None
+            for target, state in targets:
+                try:
+                    path = self.download(url, video_id, target, source)
+                except Exception as e:
+                    print(f"  Error downloading {video_id}: {e}")
+                    path = None
+                with self._count_lock:
+                    if path:
+                        self.downloaded += 1
+                    else:
+                        self.failed += 1
+                if path:
+                    state.done(video_id, path)
+                    source = path
@@ -0,0 +1,911 @@
+"""
+YouTube Shorts dataset scraper engine.
+
+Uses Selenium for discovery + yt-dlp for metadata + journaled JSON (or SQLite)
+duplicate tracking. What to look for comes from dataset profiles
+(``shorts_scraper/profiles``). Several profiles can run in one process. They
+share the browser pool, the yt-dlp worker pool and rate limit, the set of
+visited links and the duplicate index, so a video one crawl has already seen
+is never fetched again for another. Every fetched video is checked against
+all running profiles in one keyword pass and saved to each dataset it
+qualifies for, whichever crawl found it.
+
+    python -m shorts_scraper.engine giveaway_scam crypto_legit giftcards_legit
+"""
+
+import os
+import json
+import time
+import socket
+import threading
+import shutil
+import argparse
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote_plus
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+
+from shorts_scraper.tracker import DuplicateTracker, normalize_many
+from shorts_scraper.store import VideoStore
+from shorts_scraper.ratelimit import RateLimiter, Throttled, is_throttled
+from shorts_scraper.workers import map_ordered
+from shorts_scraper.ytdl import (
+    DOWNLOAD_FORMATS, download_opts, fetched_format, get_ydl, fetch_info, close_all,
+)
+from shorts_scraper.candidates import CARD_SCRIPT, Funnel, build_candidates
+from shorts_scraper.discovery import scroll_results
+from shorts_scraper.browsers import DiscoveryPool
+from shorts_scraper import chromedriver
+from shorts_scraper.downloads import DownloadQueue, DownloadLedger, StoreDownloads
+from shorts_scraper.frontier import Frontier
+from shorts_scraper.pagecache import PageCache
+from shorts_scraper.channels import ChannelRegistry
+from shorts_scraper.profiles import PROFILES, ProfileSet, load_profile
+
+# ==================================================
+# CONFIG
+# ==================================================
+MAX_VIDEOS = 15           # per profile — change to 2000 later
+SCROLL_ROUNDS = 15        # max scrolls per page — increase for better Shorts discovery
+SCROLL_STALE_ROUNDS = 2   # stop after this many scrolls in a row add no new videos
+SCROLL_TIMEOUT = 4.0      # seconds to wait for a scroll to load more results
+REFRESH_SCROLL_ROUNDS = 3  # max scrolls when re-crawling a page crawled before
+PAGE_CACHE_TTL = 12 * 3600  # seconds a page's links are reused instead of reloading it
+PAGE_CACHE_MAX_DOUBLINGS = 3  # TTL doubles per crawl with no new links, up to 8x
+EXPLORATION_RATE = 0.2    # share of pages taken in queue order instead of by past yield
+CHANNEL_TTL = 7 * 24 * 3600  # seconds before a channel's Shorts page is queued again
+CHANNEL_MIN_FETCHED = 5   # videos of a channel fetched before its acceptance rate counts
+CHANNEL_SKIP_RATE = 0.1   # acceptance rate at or below which a channel's page is skipped
+CHANNEL_ACCEPT_RATE = 0.9  # acceptance rate at or above which a channel counts as in-class
+CHANNEL_BULK_ACCEPT = False  # accept in-class channels' videos without an include keyword
+DISCOVERY_SESSIONS = 3    # headless Chrome sessions crawling pages in parallel
+HEADLESS = True           # set False to watch the discovery browsers
+RESUME_FRONTIER = True    # continue the previous run's pending pages; False = start over
+CHROMEDRIVER_PATH = None  # pre-provisioned chromedriver; None = cached lookup
+DOWNLOAD_VIDEOS = True    # set False to only scrape metadata
+DOWNLOAD_FORMAT = "480p"  # key of ytdl.DOWNLOAD_FORMATS: "best", "480p", "480p-video", "audio"
+DOWNLOAD_WORKERS = 2      # concurrent video downloads
+DOWNLOAD_QUEUE_SIZE = 20  # queued downloads before the crawler waits for the downloaders
+DOWNLOAD_RATE_LIMIT = None  # total bytes/s across all downloads (e.g. 5 * 1024 * 1024)
+DOWNLOAD_RATE = 0.5       # max video downloads started per second
+MIN_VIEW_COUNT = 500      # ignore very low-quality / spam content
+MAX_DURATION = 60         # seconds — keep Shorts focus (change to None for all videos)
+METADATA_WORKERS = 4      # concurrent yt-dlp metadata extractions
+METADATA_RATE = 1.0       # max extract_info calls per second across all workers
+METADATA_BURST = 2        # extract_info calls allowed back to back within that rate
+PAGE_LOAD_RATE = 0.2      # max search / channel page loads per second across all browsers
+METADATA_ONLY = True      # skip format resolution until a video is downloaded
+PREFILTER_TITLE_KEYWORDS = False  # also require a keyword in the card title (lossy)
+
+# "json"   = each profile's index file + one metadata JSON per video
+# "sqlite" = index, metadata and download state in each profile's DATABASE_FILE
+STORAGE_BACKEND = "json"
+
+
+# ==================================================
+# UTILS
+# ==================================================
+def extract_hashtags(description: str, tags: list) -> list:
+    hashtags = []
+    if description:
+        hashtags.extend([w for w in description.split() if w.startswith("#")])
+    if tags:
+        hashtags.extend([f"#{tag}" for tag in tags if tag])
+    return list(set(hashtags)) if hashtags else None
+
+
+def setup_driver(profile_dir=None):
+    options = Options()
+    if profile_dir:
+        # Separate profile per session so parallel Chromes don't share state
+        options.add_argument(f"--user-data-dir={profile_dir}")
+    if HEADLESS:
+        options.add_argument("--headless=new")
+        options.add_argument("--window-size=1920,1080")
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    options.add_argument("--start-maximized")
+    options.add_argument("--disable-notifications")
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    options.add_experimental_option("useAutomationExtension", False)
+    return webdriver.Chrome(
+        service=Service(chromedriver.driver_path(CHROMEDRIVER_PATH)), options=options
+    )
+
+
+# ==================================================
+# DISCOVERY
+# ==================================================
+def link_key(candidate):
+    """The key a discovered link is tracked by: its video id, else its URL."""
+    return candidate["video_id"] or candidate["url"]
+
+
+def youtube_shorts_search_url(query):
+    # sp=EgIYAQ%3D%3D filters results to Shorts only
+    return f"https://www.youtube.com/results?search_query={quote_plus(query)}&sp=EgIYAQ%3D%3D"
+
+
+def discover_video_links(driver, url, rounds=None, wanted=None, count_new=None):
+    print(f"  Loading search page...")
+    driver.get(url)
+    if "/sorry/" in driver.current_url:
+        raise Throttled("YouTube bot check page")
+    scroll_results(
+        driver, rounds or SCROLL_ROUNDS, SCROLL_STALE_ROUNDS, SCROLL_TIMEOUT, wanted, count_new
+    )
+
+    candidates = build_candidates(driver.execute_script(CARD_SCRIPT))
+    print(f"  Found {len(candidates)} unique videos")
+    return candidates
+
+
+# ==================================================
+# METADATA EXTRACTION
+# ==================================================
+def channel_of(info):
+    """Return ``{"id", "name", "url"}`` for the video's channel, or None."""
+    name = info.get("channel") or info.get("uploader")
+    channel_id = info.get("channel_id")
+    if channel_id:
+        return {
+            "id": channel_id, "name": name,
+            "url": f"https://www.youtube.com/channel/{channel_id}/shorts",
+        }
+    if name:
+        # No id in the info: fall back to the display name as a handle
+        handle = name.replace(" ", "")
+        return {"id": f"@{handle}", "name": name, "url": f"https://www.youtube.com/@{handle}/shorts"}
+    return None
+
+
+def extract_metadata(url, profiles, trusted=None, limiter=None):
+    """Return ``(channel, records, note, recheck)`` for a video.
+
+    ``records`` holds one ``(profile, record)`` per profile in ``profiles``
+    the video qualifies for, or is None if YouTube throttled the request
+    (after backing off ``limiter``) and the video should be tried again
+    later. ``channel`` (see ``channel_of``) is set whenever the keyword
+    rules were checked, accepted or not. ``trusted(channel_id)`` optionally
+    returns the profiles that take the channel's videos without an include
+    keyword. ``note`` is the line to log for a skipped video, or None; this
+    runs on the metadata pool, so the caller prints it in link order.
+    ``recheck`` is True if the video was rejected for a reason that may not
+    hold next time (its view count, an extraction error).
+    """
+    try:
+        info = fetch_info(url, metadata_only=METADATA_ONLY)
+
+        # Skip live streams
+        if info.get("is_live") or info.get("was_live"):
+            return None, [], "  ⊗ Skipping live stream", False
+
+        # Duration filter
+        duration = info.get("duration", 0)
+        if MAX_DURATION is not None and duration > MAX_DURATION:
+            return None, [], f"  ⊗ Too long ({duration}s > {MAX_DURATION}s) - skipped", False
+
+        # View count filter — skip very low-traffic / spam
+        view_count = info.get("view_count", 0) or 0
+        if view_count < MIN_VIEW_COUNT:
+            return (
+                None, [], f"  ⊗ Too few views ({view_count:,} < {MIN_VIEW_COUNT:,}) - skipped", True
+            )
+
+        title = info.get("title", "")
+        description = info.get("description", "")
+        tags = info.get("tags", [])
+        text_blob = f"{title} {description} {' '.join(tags)}"
+
+        # Every profile's rules in one scan; the video may fit several datasets
+        channel = channel_of(info)
+        routes = profiles.route(
+            text_blob, trusted(channel["id"]) if trusted and channel else ()
+        )
+        if not routes:
+            criteria = " / ".join(dict.fromkeys(p.criteria for p in profiles))
+            return channel, [], f"  ⊗ Filtered out (does not meet {criteria} criteria)", False
+
+        hashtags = extract_hashtags(description, tags)
+        video_id = info["id"]
+        shorts_url = f"https://www.youtube.com/shorts/{video_id}"
+
+        record = {
+            "video_id": f"youtube_{video_id}",
+            "platform": "youtube",
+            "video_url": shorts_url,
+            "title": title,
+            "description": description,
+            "uploader": info.get("uploader"),
+            "channel": info.get("channel"),
+            "channel_id": info.get("channel_id"),
+            "upload_date": info.get("upload_date"),
+            "duration": duration,
+            "view_count": view_count,
+            "like_count": info.get("like_count"),
+            "comment_count": info.get("comment_count"),
+            "tags": tags if tags else [],
+            "hashtags": hashtags,
+            "is_short": True,
+            "download_format": DOWNLOAD_FORMAT if DOWNLOAD_VIDEOS else None,
+            "download_format_spec": (
+                DOWNLOAD_FORMATS[DOWNLOAD_FORMAT]["format"] if DOWNLOAD_VIDEOS else None
+            ),
+            "label": None,
+            "category": None,
+            "scraped_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "scraper_id": socket.gethostname(),
+        }
+        return channel, [
+            (profile, dict(record, label=profile.label, category=category))
+            for profile, category in routes
+        ], None, False
+    except Exception as e:
+        note = f"  Error extracting metadata: {e}"
+        if is_throttled(e):
+            if limiter is not None:
+                limiter.backoff()
+            return None, None, note, True
+        return None, [], note, True
+
+
+# ==================================================
+# SAVE
+# ==================================================
+def save_metadata(meta, profile, store=None):
+    if store is not None:
+        if store.save_metadata(meta, profile.dataset):
+            print(
+                f"  ✓ Saved: {meta['video_id']} | {meta['view_count']:,} views"
+                f" | [{meta['category']}]"
+            )
+            return True
+        return False
+
+    path = metadata_path(meta["video_id"], profile)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    if not os.path.exists(path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(meta, f, indent=2, ensure_ascii=False)
+        print(
+            f"  ✓ Saved: {meta['video_id']} | {meta['view_count']:,} views"
+            f" | [{meta['category']}]"
+        )
+        return True
+    return False
+
+
+def metadata_path(video_id, profile):
+    """Where the JSON backend keeps the metadata record of ``video_id``."""
+    return os.path.join(profile.output_dir, "metadata", profile.dataset, f"{video_id}.json")
+
+
+def record_fetched_format(video_id, metadata_file, fetched):
+    """Add ``downloaded_format`` (what yt-dlp actually fetched) to a metadata file."""
+    try:
+        with open(metadata_file, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        meta["downloaded_format"] = fetched
+        tmp_path = metadata_file + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, metadata_file)
+    except Exception as e:
+        print(f"  ⚠ Could not record the downloaded format of {video_id}: {e}")
+
+
+def video_path(video_id, profile):
+    """Where the file for ``video_id`` goes in ``DOWNLOAD_FORMAT``."""
+    ext = DOWNLOAD_FORMATS[DOWNLOAD_FORMAT]["ext"]
+    return os.path.join(profile.output_dir, "videos", profile.dataset, f"{video_id}.{ext}")
+
+
+def is_already_downloaded(video_id, profile, store=None):
+    """Return True if the file for this video already exists on disk."""
+    if store is not None:
+        return store.is_already_downloaded(video_id)
+    return os.path.exists(video_path(video_id, profile))
+
+
+_last_fetch = threading.local()   # per download worker: (path, format) of its last fetch
+
+
+def download_video(url, video_id, profile, store=None, source=None, limiter=None):
+    """Download into the profile's videos directory; return the file path or None.
+
+    ``source`` is a copy already downloaded for another dataset: it is
+    hard-linked (or copied) instead of fetched again. Actual fetches wait on
+    ``limiter`` and back it off when YouTube throttles them.
+    """
+    if not DOWNLOAD_VIDEOS:
+        return None
+
+    path = video_path(video_id, profile)
+    base = os.path.dirname(path)
+    os.makedirs(base, exist_ok=True)
+
+    if os.path.exists(path):
+        print(f"  ⊗ Already downloaded: {video_id}")
+        if store is not None:
+            store.mark_downloaded(video_id, path)
+        return path
+
+    if source and os.path.exists(source):
+        try:
+            try:
+                os.link(source, path)
+            except OSError:
+                shutil.copy2(source, path)
+            # The job's targets run on one worker thread, so the source is
+            # this thread's last fetch and the format is the same
+            last = getattr(_last_fetch, "result", None)
+            fetched = last[1] if last and last[0] == source else None
+            if store is not None:
+                store.mark_downloaded(video_id, path, fetched)
+            elif fetched:
+                record_fetched_format(video_id, metadata_path(video_id, profile), fetched)
+            print(f"  ⬇ Linked: {video_id} → {profile.dataset}")
+            return path
+        except Exception as e:
+            print(f"  Error linking download, fetching again: {e}")
+
+    print(f"  Downloading video {video_id}...")
+    ydl_opts = {
+        # One instance serves every video, so the filename comes from the id
+        "outtmpl": os.path.join(base, "youtube_%(id)s.%(ext)s"),
+        **download_opts(DOWNLOAD_FORMAT),
+        "quiet": True,
+        "no_warnings": True,
+    }
+    if DOWNLOAD_RATE_LIMIT:
+        # yt-dlp limits each download; split the budget between the workers
+        ydl_opts["ratelimit"] = DOWNLOAD_RATE_LIMIT / DOWNLOAD_WORKERS
+
+    try:
+        if limiter is not None:
+            limiter.wait()
+        info = get_ydl(f"download:{DOWNLOAD_FORMAT}:{base}", ydl_opts).extract_info(
+            url, download=True
+        )
+        if os.path.exists(path):
+            # The selectors fall back to other formats: record what was fetched
+            fetched = dict(fetched_format(info or {}), filesize=os.path.getsize(path))
+            _last_fetch.result = (path, fetched)
+            if store is not None:
+                store.mark_downloaded(video_id, path, fetched)
+            else:
+                record_fetched_format(video_id, metadata_path(video_id, profile), fetched)
+            size_mb = fetched["filesize"] / (1024 * 1024)
+            height = f", {fetched['height']}p" if fetched["height"] else ""
+            print(
+                f"  ⬇ Downloaded: {video_id}"
+                f" ({size_mb:.1f} MB, format {fetched['format_id']}{height})"
+            )
+            return path
+    except Exception as e:
+        print(f"  Error downloading: {e}")
+        if limiter is not None and is_throttled(e):
+            limiter.backoff()
+    return None
+
+
+# ==================================================
+# SHARED DUPLICATE INDEX
+# ==================================================
+class SharedIndex:
+    """One duplicate index over every running profile's tracker or store.
+
+    A video counts as a duplicate if any profile has it; new videos are
+    recorded in the index of the profile that accepted them.
+    """
+
+    def __init__(self, profiles, backend):
+        self.members = {}    # profile name -> DuplicateTracker / VideoStore
+        opened = {}          # profiles may share an index file or database
+        for profile in profiles:
+            if backend == "sqlite":
+                key = profile.database_file
+                if key not in opened:
+                    opened[key] = VideoStore(profile.database_file, profile.dataset)
+            else:
+                key = profile.tracking_file
+                if key not in opened:
+                    opened[key] = DuplicateTracker(profile.tracking_file)
+            self.members[profile.name] = opened[key]
+        self.indexes = list(opened.values())
+        self.backend = backend
+
+    def store(self, profile):
+        """The profile's ``VideoStore`` with the sqlite backend, else None."""
+        return self.members[profile.name] if self.backend == "sqlite" else None
+
+    def is_duplicate(self, video_url, video_id=None):
+        return any(index.is_duplicate(video_url, video_id) for index in self.indexes)
+
+    def known_ids(self, video_ids):
+        """Return the subset of bare ``video_ids`` any profile has already."""
+        remaining, known = set(video_ids), set()
+        for index in self.indexes:
+            if not remaining:
+                break
+            found = index.known_ids(remaining)
+            known |= found
+            remaining -= found
+        return known
+
+    def add_video(self, profile, video_url, video_id, metadata=None):
+        self.members[profile.name].add_video(video_url, video_id, metadata)
+
+    def flush(self):
+        """Commit every index's pending writes."""
+        for index in self.indexes:
+            index.flush()
+
+    def get_stats(self):
+        stats = [index.get_stats() for index in self.indexes]
+        oldest = [s["oldest"] for s in stats if s["oldest"]]
+        newest = [s["newest"] for s in stats if s["newest"]]
+        return {
+            "total_scraped": sum(s["total_scraped"] for s in stats),
+            "oldest": min(oldest, default=None),
+            "newest": max(newest, default=None),
+        }
+
+    def close(self):
+        for index in self.indexes:
+            index.close()
+
+
+# ==================================================
+# MAIN CRAWLER
+# ==================================================
+def crawl(profiles):
+    profiles = ProfileSet(profiles)
+    print("=" * 70)
+    for profile in profiles:
+        print(profile.title)
+    print(
+        f"Min views: {MIN_VIEW_COUNT:,} | Target: {MAX_VIDEOS} videos per profile"
+        + (f" | Download format: {DOWNLOAD_FORMAT}" if DOWNLOAD_VIDEOS else "")
+    )
+    print("=" * 70)
+
+    if DOWNLOAD_VIDEOS:
+        download_opts(DOWNLOAD_FORMAT)   # fail fast on an unknown format name
+    duplicate_tracker = SharedIndex(profiles, STORAGE_BACKEND)
+    stats = duplicate_tracker.get_stats()
+    print(f"✓ Previously scraped: {stats['total_scraped']} videos")
+    if stats["oldest"]:
+        print(f"  First scraped: {stats['oldest']}")
+        print(f"  Last scraped:  {stats['newest']}")
+    print("=" * 70)
+
+    # Separate request budgets; each sleeps only when its budget is used up
+    # and backs off when YouTube answers with 429 / a bot check
+    page_limiter = RateLimiter(PAGE_LOAD_RATE, DISCOVERY_SESSIONS, "page loads")
+    metadata_limiter = RateLimiter(METADATA_RATE, METADATA_BURST, "metadata")
+    download_limiter = RateLimiter(DOWNLOAD_RATE, DOWNLOAD_WORKERS, "downloads")
+
+    # Videos are downloaded on their own threads; each dataset keeps its
+    # pending downloads (in the database or a ledger file) so a later run
+    # resumes what this one leaves unfinished.
+    download_states = {}
+    downloads = None
+    if DOWNLOAD_VIDEOS:
+        for profile in profiles:
+            store = duplicate_tracker.store(profile)
+            download_states[profile.name] = (
+                StoreDownloads(store, profile.dataset) if store is not None
+                else DownloadLedger(profile.download_queue_file)
+            )
+        downloads = DownloadQueue(
+            lambda url, video_id, profile, source:
+                download_video(
+                    url, video_id, profile, duplicate_tracker.store(profile), source,
+                    download_limiter,
+                ),
+            DOWNLOAD_WORKERS, DOWNLOAD_QUEUE_SIZE,
+        )
+        resumed = {}   # video_id -> (url, [(profile, state)])
+        for profile in profiles:
+            state = download_states[profile.name]
+            for video_id, url in state.pending():
+                resumed.setdefault(video_id, (url, []))[1].append((profile, state))
+        if resumed:
+            print(f"✓ Resuming {len(resumed)} unfinished downloads")
+            downloads.resume(
+                (url, video_id, targets) for video_id, (url, targets) in resumed.items()
+            )
+
+    metadata_pool = ThreadPoolExecutor(
+        max_workers=METADATA_WORKERS, thread_name_prefix="metadata"
+    )
+    collected = {profile.name: 0 for profile in profiles}
+    skipped_duplicates = 0
+    funnel = Funnel(["admission", "prefilter", "metadata", "dedup"])
+
+    def remaining(profile):
+        return MAX_VIDEOS - collected[profile.name]
+
+    def collecting():
+        return [p for p in profiles if remaining(p) > 0]
+
+    # Each page's last discovery result; fresh entries skip the browser
+    page_caches = {
+        profile.name: PageCache(profile.page_cache_file, PAGE_CACHE_TTL, PAGE_CACHE_MAX_DOUBLINGS)
+        for profile in profiles
+    }
+    page_counts = Counter()
+
+    # Per-dataset channel history: when each channel was last queued and
+    # how many of its videos were accepted
+    channel_registries = {
+        profile.name: ChannelRegistry(
+            profile.channels_file, CHANNEL_TTL,
+            CHANNEL_MIN_FETCHED, CHANNEL_SKIP_RATE, CHANNEL_ACCEPT_RATE,
+        )
+        for profile in profiles
+    }
+    channel_counts = Counter()
+
+    def trusted_by(channel_id):
+        return [
+            profile for profile in profiles
+            if channel_registries[profile.name].verdict(channel_id) == "accept"
+        ]
+
+    # One frontier of (page, profile), checkpointed to each profile's
+    # FRONTIER_FILE so a restarted run continues where this one stops.
+    # The page whose past crawls paid off best goes next.
+    frontier = Frontier(
+        profiles,
+        lambda profile: [youtube_shorts_search_url(q) for q in profile.search_queries],
+        RESUME_FRONTIER,
+        score=lambda url, profile: page_caches[profile.name].score(url),
+        explore=EXPLORATION_RATE,
+    )
+    visited = frontier.visited
+    if frontier.resumed:
+        print(
+            f"✓ Resuming crawl: {frontier.resumed} pages pending,"
+            f" {len(visited)} links already seen"
+        )
+
+    def count_new(hrefs):
+        """How many of ``hrefs`` are neither visited nor in the duplicate index."""
+        fresh = [
+            (url, video_id) for url, video_id in dict(normalize_many(hrefs)).items()
+            if (video_id or url) not in visited
+        ]
+        known = duplicate_tracker.known_ids(video_id for _, video_id in fresh if video_id)
+        return sum(
+            1 for url, video_id in fresh
+            if not (video_id in known if video_id else duplicate_tracker.is_duplicate(url))
+        )
+
+    def discover(driver, page):
+        url, profile = page
+        # A page crawled before only gets a short scroll for new results
+        rounds = REFRESH_SCROLL_ROUNDS if url in page_caches[profile.name] else SCROLL_ROUNDS
+        page_limiter.wait()
+        # (runs on a discovery session: count_new only reads visited and the index)
+        return discover_video_links(driver, url, rounds, remaining(profile), count_new)
+
+    # Pages are scrolled on DISCOVERY_SESSIONS browsers at once; each finished
+    # page's links go straight into the metadata stage below.
+    browsers = DiscoveryPool(setup_driver, discover, DISCOVERY_SESSIONS)
+    cached_pages = deque()   # (page, links) served from the page cache
+
+    def fill_sessions():
+        while frontier and browsers.in_flight < DISCOVERY_SESSIONS:
+            page = frontier.pop()
+            if remaining(page[1]) <= 0:
+                continue
+            links = page_caches[page[1].name].fresh(page[0])
+            if links is not None:
+                cached_pages.append((page, links))
+                continue
+            browsers.submit(page)
+
+    try:
+        fill_sessions()
+        while (cached_pages or browsers.in_flight) and collecting():
+            if cached_pages:
+                (page, page_profile), found = cached_pages.popleft()
+                error, from_cache = None, True
+                page_counts["cached"] += 1
+            else:
+                (page, page_profile), found, error = browsers.next_result()
+                from_cache = False
+                page_counts["refreshed" if page in page_caches[page_profile.name] else "crawled"] += 1
+            fill_sessions()
+            print(f"\n[>] {'Cached' if from_cache else 'Crawled'} ({page_profile.name}): {page[:80]}...")
+            if error is not None:
+                print(f"  Error discovering links: {error}")
+                if is_throttled(error):
+                    page_limiter.backoff()
+                    frontier.retry(page, page_profile)
+                    fill_sessions()
+                continue
+
+            # Admission by canonical video id: links seen this run are
+            # dropped, then the rest are checked against the duplicate index
+            # in one lookup
+            fresh = []
+            seen = []   # link keys first looked at on this page
+            funnel.enter("admission", len(found))
+            for candidate in found:
+                key = link_key(candidate)
+                if key in visited:
+                    funnel.reject("admission", "visited")
+                    continue
+                visited.add(key)
+                seen.append(key)
+                fresh.append(candidate)
+            known = duplicate_tracker.known_ids(c["video_id"] for c in fresh if c["video_id"])
+            new = [
+                c for c in fresh
+                if not (c["video_id"] in known if c["video_id"] else duplicate_tracker.is_duplicate(c["url"]))
+            ]
+            duplicates = len(fresh) - len(new)
+            if duplicates:
+                funnel.reject("admission", "duplicate", duplicates)
+                skipped_duplicates += duplicates
+                print(
+                    f"  ⊗ {duplicates} already scraped previously"
+                    f" (Total duplicates: {skipped_duplicates})"
+                )
+
+            candidates = []
+            recheck = set()   # rejected links to look at again next pass
+            for candidate in new:
+                # Title / view-count checks from the search card, before yt-dlp
+                funnel.enter("prefilter")
+                # (rejected only if no profile still collecting would take it)
+                reason = profiles.prefilter(
+                    candidate, MIN_VIEW_COUNT, PREFILTER_TITLE_KEYWORDS, collecting()
+                )
+                if reason:
+                    funnel.reject("prefilter", reason)
+                    # Views grow, and a quota-limited check may pass next pass
+                    if reason == "views" or len(collecting()) < len(profiles):
+                        recheck.add(link_key(candidate))
+                    continue
+
+                candidates.append(candidate)
+
+            # Metadata is fetched concurrently; results arrive in link order
+            processed = accepted = 0
+            throttled = []   # links to look at again once YouTube lets up
+            for candidate, (channel, routes, note, retry) in map_ordered(
+                lambda candidate: extract_metadata(
+                    candidate["url"], profiles, trusted_by if CHANNEL_BULK_ACCEPT else None,
+                    metadata_limiter,
+                ),
+                candidates,
+                METADATA_WORKERS, metadata_limiter, metadata_pool,
+            ):
+                if not collecting():
+                    break
+                processed += 1
+                video_url = candidate["url"]
+
+                funnel.enter("metadata")
+                print(
+                    f"\n[{sum(collected.values()) + 1}/{MAX_VIDEOS * len(profiles)}]"
+                    f" Processing: {video_url[:60]}..."
+                )
+                if note:
+                    print(note)
+                if routes is None:
+                    funnel.reject("metadata", "throttled")
+                    throttled.append(link_key(candidate))
+                    visited.discard(link_key(candidate))
+                    continue
+                if channel is not None:
+                    routed = {p.name for p, _ in routes}
+                    for profile in profiles:
+                        channel_registries[profile.name].record(channel, profile.name in routed)
+                if not routes:
+                    funnel.reject("metadata", "filtered")
+                    if retry:
+                        recheck.add(link_key(candidate))
+                    continue
+                routes = [(p, meta) for p, meta in routes if remaining(p) > 0]
+                if not routes:
+                    funnel.reject("metadata", "quota reached")
+                    recheck.add(link_key(candidate))
+                    continue
+                video_id = routes[0][1]["video_id"]
+                if len(routes) > 1:
+                    print(f"  → Matches {len(routes)} datasets: {', '.join(p.name for p, _ in routes)}")
+
+                # Secondary duplicate check by video ID
+                funnel.enter("dedup")
+                if duplicate_tracker.is_duplicate(video_url, video_id):
+                    funnel.reject("dedup", "duplicate id")
+                    skipped_duplicates += 1
+                    print(
+                        f"  ⊗ Duplicate by video ID"
+                        f" (Total duplicates: {skipped_duplicates})"
+                    )
+                    continue
+
+                saved = []
+                for profile, meta in routes:
+                    store = duplicate_tracker.store(profile)
+                    # Skip if the video file is already on disk
+                    if DOWNLOAD_VIDEOS and is_already_downloaded(video_id, profile, store):
+                        print(f"  ⊗ Already downloaded: {video_id} [{profile.name}] — skipping")
+                        continue
+
+                    if save_metadata(meta, profile, store):
+                        collected[profile.name] += 1
+                        saved.append(profile)
+                        duplicate_tracker.add_video(profile, video_url, video_id, meta)
+
+                if saved and downloads is not None:
+                    # Downloads run in the background; this only waits when
+                    # DOWNLOAD_QUEUE_SIZE videos are already queued
+                    downloads.submit(
+                        video_url, video_id,
+                        [(profile, download_states[profile.name]) for profile in saved],
+                    )
+
+                if not saved:
+                    funnel.reject("dedup", "downloaded")
+                    skipped_duplicates += 1
+                    continue
+                accepted += 1
+
+                print(
+                    f"  ✓ Total collected: {sum(collected.values())}/{MAX_VIDEOS * len(profiles)}"
+                    f" ({', '.join(f'{p.name} {collected[p.name]}' for p in saved)})"
+                    f" | Downloaded: {downloads.downloaded if downloads else 0}"
+                    f" | Duplicates skipped: {skipped_duplicates}"
+                )
+
+                # Queue the channel's Shorts page for further discovery, at
+                # most once per CHANNEL_TTL across all profiles (the crawl is
+                # shared) and only under a profile that finds it in class
+                if channel is not None and collecting() and not any(
+                    registry.queued_recently(channel["id"])
+                    for registry in channel_registries.values()
+                ):
+                    owners = [
+                        profile for profile in saved
+                        if channel_registries[profile.name].verdict(channel["id"]) != "skip"
+                    ]
+                    if not owners:
+                        channel_counts["skipped"] += 1
+                        print(f"  ⊗ Channel {channel['name']} rarely matches — not expanding")
+                    elif frontier.push(channel["url"], owners[0]):
+                        for registry in channel_registries.values():
+                            registry.mark_queued(channel)
+                        channel_counts["queued"] += 1
+                        fill_sessions()
+                        print("  + Added channel Shorts to queue")
+
+            if not from_cache:
+                page_caches[page_profile.name].store(page, found, len(new), processed, accepted)
+
+            # Checkpoint the page; if the quota cut it short it stays pending
+            # and only the links not processed yet are looked at again. The
+            # videos saved from it are committed first, so a link is never
+            # recorded as visited while its video could still be lost.
+            duplicate_tracker.flush()
+            unprocessed = {link_key(c) for c in candidates[processed:]} | set(throttled)
+            frontier.checkpoint(
+                page, page_profile, [key for key in seen if key not in unprocessed],
+                finished=not unprocessed, recheck=recheck,
+            )
+
+        if downloads is not None and downloads.backlog():
+            print(f"\nWaiting for {downloads.backlog()} queued downloads...")
+        if downloads is not None:
+            downloads.close(wait=True)
+
+        print("\n" + "=" * 70)
+        print("✓ SCRAPING COMPLETE!")
+        print(f"  New videos collected:           {sum(collected.values())}")
+        for profile in profiles:
+            print(f"    {profile.name:<30}{collected[profile.name]}")
+        if downloads is not None:
+            print(
+                f"  Videos downloaded:              {downloads.downloaded}"
+                + (f" ({downloads.failed} failed)" if downloads.failed else "")
+            )
+        print(f"  Duplicates skipped:             {skipped_duplicates}")
+        print(
+            f"  Pages crawled:                  {page_counts['crawled'] + page_counts['refreshed']}"
+            f" ({page_counts['refreshed']} short refreshes, {page_counts['cached']} from cache)"
+        )
+        print(
+            f"  Channels queued:                {channel_counts['queued']}"
+            f" ({channel_counts['skipped']} skipped as out of class)"
+        )
+        limiters = (page_limiter, metadata_limiter, download_limiter)
+        if any(limiter.backoffs for limiter in limiters):
+            print(
+                "  Throttled by YouTube:           "
+                + ", ".join(f"{limiter.name} {limiter.backoffs}x" for limiter in limiters)
+            )
+        print(f"  Browser sessions restarted:     {browsers.restarts}")
+        if browsers.launch_seconds:
+            print(
+                f"  Browser startup:                {browsers.launch_seconds[0]:.1f}s first"
+                f" | {sum(browsers.launch_seconds) / len(browsers.launch_seconds):.1f}s avg"
+                f" over {len(browsers.launch_seconds)} launches"
+                f" (driver lookup {chromedriver.resolve_seconds:.2f}s)"
+            )
+        funnel.report()
+
+        final_stats = duplicate_tracker.get_stats()
+        print(f"  Total unique videos in database: {final_stats['total_scraped']}")
+        print("=" * 70)
+
+    except KeyboardInterrupt:
+        print("\n\n⚠ Interrupted by user")
+    except Exception as e:
+        print(f"\n\n✗ Fatal error: {e}")
+    finally:
+        browsers.close()
+        metadata_pool.shutdown(wait=True, cancel_futures=True)
+        if downloads is not None:
+            # Queued jobs not started yet stay pending for the next run
+            downloads.close(wait=False)
+        for state in download_states.values():
+            state.close()
+        close_all()
+        duplicate_tracker.close()
+        frontier.close()
+        for page_cache in page_caches.values():
+            page_cache.close()
+        for registry in channel_registries.values():
+            registry.close()
+        print(
+            f"\nFinal count: {sum(collected.values())} new videos"
+            f" | {skipped_duplicates} duplicates skipped"
+        )
+        for profile in profiles:
+            print(f"\nOutput directory: {os.path.abspath(profile.output_dir)}")
+            print(f"Files saved:")
+            print(f"  └── {profile.output_dir}/")
+            print(f"      ├── {os.path.basename(profile.frontier_file)}  (crawl frontier)")
+            print(f"      ├── {os.path.basename(profile.page_cache_file)}  (discovered links per page)")
+            print(f"      ├── {os.path.basename(profile.channels_file)}  (channel history)")
+            if STORAGE_BACKEND == "sqlite":
+                print(
+                    f"      ├── {os.path.basename(profile.database_file)}"
+                    f"  (index, metadata, download state)"
+                )
+            else:
+                print(
+                    f"      ├── {os.path.basename(profile.tracking_file)}"
+                    f"  (duplicate tracking)"
+                )
+                if DOWNLOAD_VIDEOS:
+                    print(
+                        f"      ├── {os.path.basename(profile.download_queue_file)}"
+                        f"  (pending downloads)"
+                    )
+                print(f"      ├── metadata/{profile.dataset}/*.json")
+            print(f"      └── videos/{profile.dataset}/*.{DOWNLOAD_FORMATS[DOWNLOAD_FORMAT]['ext']}")
+
+
+def main(profile_names=None):
+    if profile_names is None:
+        parser = argparse.ArgumentParser(
+            description="Scrape YouTube Shorts for one or more dataset profiles."
+        )
+        parser.add_argument(
+            "profiles", nargs="*", default=list(PROFILES),
+            help=f"profiles to run together (default: all of {', '.join(PROFILES)})",
+        )
+        profile_names = parser.parse_args().profiles
+    crawl([load_profile(name) for name in profile_names])
+
+
+if __name__ == "__main__":
+    main()
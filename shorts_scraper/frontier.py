@@ -0,0 +1,176 @@
+"""
+Resumable crawl frontier for the scraper engine.
+
+The queue of search and channel pages still to crawl, and the set of videos
+already looked at, used to live only in memory, so every run started
+over at the first search query. Each profile now keeps them in a JSON-lines
+log next to its index:
+
+    {"queued": url}          page added to the frontier
+    {"done": url}            page crawled and its links processed
+    {"visited": video_id}    video looked at while processing a page
+                             (the link itself when it has no video id)
+    {"recheck": video_id}    video rejected for a reason that may change
+                             (view count, extraction error, quota)
+
+A page's visited links and its ``done`` record are written together when the
+crawler has finished with the page, so after a crash the page is still
+pending and its links are simply looked at again. A page cut short (e.g. by
+the quota) records the links it did process and stays pending. Loading
+compacts the log (``journal.AppendLog``). Once a profile has no pending
+pages left the next run starts a fresh pass over its search queries; the
+visited links are kept, the ``recheck`` ones are looked at again.
+"""
+
+import random
+from collections import deque
+
+from shorts_scraper.journal import AppendLog
+from shorts_scraper.tracker import extract_video_id
+
+
+class FrontierLog:
+    """One profile's pending pages, finished pages and visited links."""
+
+    def __init__(self, path):
+        self.path = path
+        self.pending = {}     # page url -> None, in queue order
+        self.done = set()     # pages finished in the current pass
+        self.visited = set()  # video ids looked at in any pass
+        self.recheck = set()  # video ids looked at in this pass only
+        self._log = AppendLog(path, "crawl frontier")
+        for record in self._log.records():
+            if "visited" in record:
+                # Older logs recorded link URLs rather than ids
+                key = record["visited"]
+                self.visited.add(extract_video_id(key) or key)
+                self.recheck.discard(extract_video_id(key) or key)
+            elif "recheck" in record:
+                if record["recheck"] not in self.visited:
+                    self.recheck.add(record["recheck"])
+            elif "queued" in record:
+                if record["queued"] not in self.done:
+                    self.pending[record["queued"]] = None
+            elif "done" in record:
+                self.pending.pop(record["done"], None)
+                self.done.add(record["done"])
+        self._rewrite()
+
+    def _rewrite(self):
+        """Replace the log with a compact copy of the current state."""
+        self._log.rewrite([
+            *({"visited": key} for key in self.visited),
+            *({"recheck": key} for key in self.recheck),
+            *({"done": url} for url in self.done),
+            *({"queued": url} for url in self.pending),
+        ])
+
+    def restart(self):
+        """Start a new pass: forget pending and finished pages and ``recheck`` links."""
+        self.pending.clear()
+        self.done.clear()
+        self.recheck.clear()
+        self._rewrite()
+
+    def queue(self, url):
+        """Add a page; return False if it is pending or finished already."""
+        if url in self.pending or url in self.done:
+            return False
+        self.pending[url] = None
+        self._log.append({"queued": url})
+        return True
+
+    def checkpoint(self, url, visited=(), finished=True, recheck=()):
+        """Record the links a page led to and, if ``finished``, mark it done.
+
+        An unfinished page stays pending; next time it is crawled only the
+        links not recorded here are looked at again. Links in ``recheck``
+        are only skipped for the rest of this pass.
+        """
+        for key in visited:
+            if key in recheck:
+                if key not in self.recheck and key not in self.visited:
+                    self.recheck.add(key)
+                    self._log.append({"recheck": key}, flush=False)
+            elif key not in self.visited:
+                self.visited.add(key)
+                self.recheck.discard(key)
+                self._log.append({"visited": key}, flush=False)
+        if finished:
+            self.pending.pop(url, None)
+            self.done.add(url)
+            self._log.append({"done": url}, flush=False)
+        self._log.flush()
+
+    def close(self):
+        self._log.close()
+
+
+class Frontier:
+    """The crawl queue of ``(page, profile)`` over several profiles' logs.
+
+    Pending pages from the previous run come first; a profile with none
+    starts a new pass over its search queries. Pages of different profiles
+    are interleaved so every dataset makes progress from the start.
+
+    With a ``score(url, profile)`` function ``pop`` returns the best-scoring
+    pending page; a share ``explore`` of pops instead takes the oldest page,
+    so pages the scores rank low are still crawled eventually.
+    """
+
+    def __init__(self, profiles, seed_pages, resume=True, score=None, explore=0.0):
+        self.score = score
+        self.explore = explore
+        self._random = random.Random()
+        self.logs = {}
+        self.pages = deque()
+        self.visited = set()
+        self.resumed = 0
+        per_profile = []
+        for profile in profiles:
+            log = self.logs[profile.name] = FrontierLog(profile.frontier_file)
+            if resume and log.pending:
+                pages = list(log.pending)
+                self.resumed += len(pages)
+            else:
+                log.restart()
+                pages = [url for url in seed_pages(profile) if log.queue(url)]
+            self.visited |= log.visited | log.recheck
+            per_profile.append([(url, profile) for url in pages])
+        self.pages.extend(
+            pages[i]
+            for i in range(max((len(pages) for pages in per_profile), default=0))
+            for pages in per_profile if i < len(pages)
+        )
+
+    def __len__(self):
+        return len(self.pages)
+
+    def __bool__(self):
+        return bool(self.pages)
+
+    def pop(self):
+        """Remove and return the next ``(page, profile)`` to crawl."""
+        if self.score is None or len(self.pages) == 1 or self._random.random() < self.explore:
+            return self.pages.popleft()
+        best = max(self.pages, key=lambda page: self.score(*page))   # ties: oldest first
+        self.pages.remove(best)
+        return best
+
+    def push(self, url, profile):
+        """Queue a page unless this pass already has it; return True if queued."""
+        if not self.logs[profile.name].queue(url):
+            return False
+        self.pages.append((url, profile))
+        return True
+
+    def retry(self, url, profile):
+        """Put a pending page that could not be crawled back in the queue."""
+        self.pages.append((url, profile))
+
+    def checkpoint(self, url, profile, visited=(), finished=True, recheck=()):
+        self.logs[profile.name].checkpoint(url, visited, finished, recheck)
+
+    def close(self):
+        for log in self.logs.values():
+            log.close()
@@ -0,0 +1,65 @@
+"""
+JSON-lines append logs for the engine's resumable state.
+
+The download ledger, crawl frontier, page cache and channel registry each
+keep their state as a file of JSON records appended as things happen; the
+owner decides what a record means and replays them in order on load.
+
+``AppendLog`` does the file handling they share: reading the records back
+(skipping a torn last line left by a crash), rewriting the file as a compact
+copy of the current state (fsynced and swapped in with ``os.replace``, so a
+crash mid-rewrite keeps the old file) and appending new records.
+"""
+
+import os
+import json
+
+
+class AppendLog:
+    """One JSON-lines file: ``records`` to load, ``rewrite`` to compact, ``append``."""
+
+    def __init__(self, path, name):
+        self.path = path
+        self.name = name   # what the log holds, for error messages
+        self._file = None
+
+    def records(self):
+        """Yield the records in the file, skipping lines that do not parse."""
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue   # torn last line
+                    yield record
+        except Exception as e:
+            print(f"⚠ Error loading {self.name}: {e}")
+
+    def rewrite(self, records):
+        """Replace the file with ``records`` and reopen it for appending."""
+        self.close()
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def append(self, record, flush=True):
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        if flush:
+            self._file.flush()
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,89 @@
+"""
+Single-pass keyword matching for the scraper filters.
+
+``KeywordMatcher`` builds one automaton over every keyword from several named
+lists, so a text is scanned a single time no matter how many lists or
+keywords there are. The result is the same as running ``k in text.lower()``
+for every keyword: matching is case-insensitive substring matching, and
+overlapping keywords are all reported.
+
+With ``pyahocorasick`` installed the automaton is a C Aho-Corasick automaton.
+Without it ``scan`` falls back to the plain ``k in text`` checks the filters
+used before. It returns the same ``{list name: keywords found}`` dict, but
+each list's set is only worked out when it is used, and testing it for
+truth (all the filters do) stops at the first keyword found.
+"""
+
+from collections.abc import Set
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+class _Found(Set):
+    """Keywords of one list occurring in a text, found when first needed."""
+
+    __slots__ = ("keywords", "text", "_found")
+
+    def __init__(self, keywords, text):
+        self.keywords = keywords
+        self.text = text
+        self._found = None
+
+    def __bool__(self):
+        if self._found is not None:
+            return bool(self._found)
+        text = self.text
+        for keyword in self.keywords:
+            if keyword in text:
+                return True
+        return False
+
+    def _all(self):
+        if self._found is None:
+            self._found = {keyword for keyword in self.keywords if keyword in self.text}
+        return self._found
+
+    def __contains__(self, keyword):
+        return keyword in self._all()
+
+    def __iter__(self):
+        return iter(self._all())
+
+    def __len__(self):
+        return len(self._all())
+
+    def __repr__(self):
+        return repr(self._all())
+
+
+class KeywordMatcher:
+    """Finds keywords from several named lists in a text."""
+
+    def __init__(self, lists):
+        self.lists = {name: tuple(keywords) for name, keywords in lists.items()}
+        self._owners = {}   # keyword -> names of the lists containing it
+        for name, keywords in self.lists.items():
+            for keyword in keywords:
+                self._owners.setdefault(keyword, []).append(name)
+        self._automaton = None
+        if ahocorasick is not None and self._owners:
+            self._automaton = ahocorasick.Automaton()
+            for keyword in sorted(self._owners):
+                self._automaton.add_word(keyword, keyword)
+            self._automaton.make_automaton()
+
+    def scan(self, text):
+        """Return ``{list name: set of its keywords found in text}`` (case-insensitive)."""
+        if not text or not self._owners:
+            return {name: set() for name in self.lists}
+        if self._automaton is None:
+            text = text.lower()
+            return {name: _Found(keywords, text) for name, keywords in self.lists.items()}
+        found = {name: set() for name in self.lists}
+        for _, keyword in self._automaton.iter(text.lower()):
+            for name in self._owners[keyword]:
+                found[name].add(keyword)
+        return found
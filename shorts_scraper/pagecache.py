@@ -0,0 +1,112 @@
+"""
+Discovery results cache for search and channel pages.
+
+Scrolling a page takes tens of seconds and mostly turns up links seen
+before. ``PageCache`` remembers, per page URL, the candidates the last crawl
+found, when that was, and how many of them were new (neither visited nor
+already in the duplicate index). While an entry is fresh the engine uses the
+cached candidates instead of opening the page. After that a known page only
+gets a short refresh scroll, since its deeper results were seen last time.
+A page that yielded nothing new stays fresh for longer each time: its TTL
+doubles per unproductive crawl, up to ``max_doublings`` times.
+
+The same history ranks the crawl frontier (``score``): how many fetched
+videos the page's links got accepted, how many of its links were new, and
+how long ago it was crawled. A page never crawled scores the average
+acceptance rate of its kind (search or channel page).
+
+Entries are appended to a JSON-lines file (``journal.AppendLog``); the last
+entry per URL wins.
+"""
+
+import time
+
+from shorts_scraper.journal import AppendLog
+
+PRIOR_WEIGHT = 5          # fetched videos a page needs before its own rate outweighs its kind's
+
+
+def page_kind(url):
+    return "channel" if "/@" in url or "/channel/" in url else "search"
+
+
+class PageCache:
+    """Last discovery result per page URL, with a yield-scaled TTL."""
+
+    def __init__(self, path, ttl, max_doublings=3):
+        self.path = path
+        self.ttl = ttl
+        self.max_doublings = max_doublings
+        self.entries = {}   # url -> {"links", "at", "new", "idle", "fetched", "accepted"}
+        self._log = AppendLog(path, "page cache")
+        for entry in self._log.records():
+            self.entries[entry.pop("url")] = entry
+        self.totals = {"search": [0, 0], "channel": [0, 0]}   # kind -> [accepted, fetched]
+        for url, entry in self.entries.items():
+            self._count(url, entry, 1)
+        self._log.rewrite({"url": url, **entry} for url, entry in self.entries.items())
+
+    def __contains__(self, url):
+        return url in self.entries
+
+    def _count(self, url, entry, sign):
+        totals = self.totals[page_kind(url)]
+        totals[0] += sign * entry.get("accepted", 0)
+        totals[1] += sign * entry.get("fetched", 0)
+
+    def ttl_for(self, url):
+        """Seconds the page's entry stays fresh (longer for low-yield pages)."""
+        entry = self.entries.get(url)
+        idle = entry["idle"] if entry else 0
+        return self.ttl * 2 ** min(idle, self.max_doublings)
+
+    def fresh(self, url, now=None):
+        """Return the cached candidates if the entry is within its TTL, else None."""
+        entry = self.entries.get(url)
+        if entry is None:
+            return None
+        now = time.time() if now is None else now
+        if now - entry["at"] >= self.ttl_for(url):
+            return None
+        return entry["links"]
+
+    def score(self, url, now=None):
+        """Expected value of crawling ``url`` next; higher is better.
+
+        Acceptance rate (shrunk towards the kind's average while the page
+        has few fetches) x share of new links x how far into its TTL the
+        entry is.
+        """
+        accepted, fetched = self.totals[page_kind(url)]
+        prior = (accepted + 1) / (fetched + 2)
+        entry = self.entries.get(url)
+        if entry is None:
+            return prior
+        now = time.time() if now is None else now
+        acceptance = (entry.get("accepted", 0) + prior * PRIOR_WEIGHT) / (
+            entry.get("fetched", 0) + PRIOR_WEIGHT
+        )
+        novelty = (entry["new"] + 1) / (len(entry["links"]) + 1)
+        ttl = self.ttl_for(url)
+        recency = min(1.0, (now - entry["at"]) / ttl) if ttl > 0 else 1.0
+        return acceptance * novelty * recency
+
+    def store(self, url, links, new, fetched=0, accepted=0):
+        """Record a crawl of ``url`` that found ``links``, ``new`` of them new.
+
+        ``fetched`` is how many of them had their metadata fetched and
+        ``accepted`` how many of those were saved.
+        """
+        previous = self.entries.get(url)
+        idle = 0 if new else (previous["idle"] + 1 if previous else 1)
+        if previous is not None:
+            self._count(url, previous, -1)
+        entry = self.entries[url] = {
+            "links": list(links), "at": int(time.time()), "new": new, "idle": idle,
+            "fetched": fetched, "accepted": accepted,
+        }
+        self._count(url, entry, 1)
+        self._log.append({"url": url, **entry})
+
+    def close(self):
+        self._log.close()
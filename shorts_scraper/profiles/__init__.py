@@ -0,0 +1,154 @@
+"""
+Dataset profiles for the Shorts scraper engine.
+
+A profile is a small module in this package holding everything that differs
+between datasets: the search queries, the include / exclude keyword lists,
+the category rules, the label and the output paths. ``load_profile`` wraps it
+in a ``Profile``, which compiles the keyword lists once and applies the
+dataset's filter and category rules. A ``ProfileSet`` evaluates several
+profiles' rules in one pass, so one fetched video can be routed to every
+dataset it qualifies for.
+"""
+
+import importlib
+
+from shorts_scraper.keywords import KeywordMatcher
+
+PROFILES = ("giveaway_scam", "crypto_legit", "giftcards_legit")   # bundled profiles
+
+
+class Profile:
+    """One dataset: its queries, keyword rules, label and output locations."""
+
+    def __init__(self, module):
+        self.name = module.__name__.rsplit(".", 1)[-1]
+        self.title = module.TITLE
+        self.output_dir = module.OUTPUT_DIR
+        self.dataset = module.DATASET
+        self.label = module.LABEL
+        self.criteria = module.CRITERIA
+        self.tracking_file = module.TRACKING_FILE
+        self.database_file = module.DATABASE_FILE
+        self.download_queue_file = module.DOWNLOAD_QUEUE_FILE
+        self.frontier_file = module.FRONTIER_FILE
+        self.page_cache_file = module.PAGE_CACHE_FILE
+        self.channels_file = module.CHANNELS_FILE
+        self.search_queries = list(module.SEARCH_QUERIES)
+        self.category_keywords = list(module.CATEGORY_KEYWORDS)
+        self.default_category = module.DEFAULT_CATEGORY
+        # Every list, matched in a single pass over a text
+        self.keywords = KeywordMatcher({
+            "include": module.INCLUDE_KEYWORDS,
+            "exclude": module.EXCLUDE_KEYWORDS,
+            **{f"category:{name}": keywords for name, keywords in self.category_keywords},
+        })
+
+    def __repr__(self):
+        return f"Profile({self.name!r})"
+
+    def accepts(self, text, matches=None):
+        """Return True if the text has an include keyword and no exclude keyword."""
+        if not text:
+            return False
+        if matches is None:
+            matches = self.keywords.scan(text)
+        return not matches["exclude"] and bool(matches["include"])
+
+    def classify_category(self, text, matches=None):
+        """Return the first category with a matching keyword, else the default."""
+        if matches is None:
+            matches = self.keywords.scan(text)
+        for category, _ in self.category_keywords:
+            if matches[f"category:{category}"]:
+                return category
+        return self.default_category
+
+    def prefilter(self, candidate, min_views, title_keywords=False, matches=None):
+        """Cheap checks on search-card data; return a rejection reason or None.
+
+        The card title is part of the metadata text blob, so an exclusion
+        keyword there rejects the video for sure. The title alone can't show
+        that include keywords are missing, so that check is opt-in.
+        ``matches`` is an optional pre-computed scan of the card title.
+        """
+        max_views = candidate.get("max_views")
+        if max_views is not None and max_views < min_views:
+            return "views"
+        title = candidate.get("title") or ""
+        if matches is None:
+            matches = self.keywords.scan(title)
+        if matches["exclude"]:
+            return "excluded keyword"
+        if title_keywords and title and not matches["include"]:
+            return "no keyword"
+        return None
+
+
+class ProfileSet:
+    """Several profiles' keyword rules, evaluated in one pass over a text."""
+
+    def __init__(self, profiles):
+        self.profiles = list(profiles)
+        self.keywords = KeywordMatcher({
+            f"{profile.name}/{name}": keywords
+            for profile in self.profiles
+            for name, keywords in profile.keywords.lists.items()
+        })
+
+    def __iter__(self):
+        return iter(self.profiles)
+
+    def __len__(self):
+        return len(self.profiles)
+
+    def scan(self, text):
+        """Return ``{profile name: that profile's matches}`` from a single scan."""
+        found = self.keywords.scan(text)
+        return {
+            profile.name: {name: found[f"{profile.name}/{name}"] for name in profile.keywords.lists}
+            for profile in self.profiles
+        }
+
+    def route(self, text, trusted=()):
+        """Return ``[(profile, category)]`` for every profile that accepts the text.
+
+        Profiles in ``trusted`` (e.g. for a video of a channel they take
+        wholesale) accept any text without an exclude keyword.
+        """
+        matches = self.scan(text)
+        return [
+            (profile, profile.classify_category(text, matches[profile.name]))
+            for profile in self.profiles
+            if profile.accepts(text, matches[profile.name])
+            or (profile in trusted and not matches[profile.name]["exclude"])
+        ]
+
+    def prefilter(self, candidate, min_views, title_keywords=False, profiles=None):
+        """Return a rejection reason if every profile rejects the card, else None.
+
+        ``profiles`` limits the check to part of the set (e.g. the profiles
+        still collecting).
+        """
+        matches = self.scan(candidate.get("title") or "")
+        reasons = [
+            profile.prefilter(candidate, min_views, title_keywords, matches[profile.name])
+            for profile in (self.profiles if profiles is None else profiles)
+        ]
+        return reasons[0] if reasons and all(reasons) else None
+
+
+_loaded = {}
+
+
+def load_profile(name):
+    """Return the ``Profile`` for ``shorts_scraper/profiles/<name>.py``."""
+    profile = _loaded.get(name)
+    if profile is None:
+        try:
+            module = importlib.import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError:
+            raise ValueError(
+                f"Unknown profile {name!r} (bundled: {', '.join(PROFILES)})"
+            ) from None
+        profile = _loaded[name] = Profile(module)
+    return profile
@@ -0,0 +1,116 @@
+"""
+Crypto "NOT SCAM" / legitimate profile.
+
+Targets educational, analytical, and news-based crypto content.
+"""
+
+import os
+
+TITLE = "YouTube Shorts Crypto NOT SCAM / Legitimate Video Scraper"
+OUTPUT_DIR = os.path.join(os.path.expanduser("~"), "Desktop", "video_crawler_legit")
+DATASET = "youtube_shorts_crypto_legit"
+LABEL = "NOT SCAM"
+CRITERIA = "legitimate content"         # shown when a video fails the filter
+
+TRACKING_FILE = os.path.join(
+    OUTPUT_DIR, "scraped_videos_index_youtube_shorts_crypto_legit.json"
+)
+DATABASE_FILE = os.path.join(OUTPUT_DIR, "crypto_not_scam.db")
+DOWNLOAD_QUEUE_FILE = os.path.join(OUTPUT_DIR, "download_queue_youtube_shorts_crypto_legit.jsonl")
+FRONTIER_FILE = os.path.join(OUTPUT_DIR, "frontier_youtube_shorts_crypto_legit.jsonl")
+PAGE_CACHE_FILE = os.path.join(OUTPUT_DIR, "page_cache_youtube_shorts_crypto_legit.jsonl")
+CHANNELS_FILE = os.path.join(OUTPUT_DIR, "channels_youtube_shorts_crypto_legit.jsonl")
+
+# YouTube Shorts legitimate crypto queries
+SEARCH_QUERIES = [
+    # Educational explanations
+    "bitcoin explained", "ethereum explained", "crypto basics tutorial",
+    "how bitcoin works", "how blockchain works", "crypto for beginners",
+    "cryptocurrency explained", "defi explained", "web3 explained",
+    "nft explained", "smart contract explained", "proof of stake explained",
+    "crypto wallet how to", "gas fees explained", "layer 2 explained",
+
+    # Honest reviews and analysis
+    "crypto honest review", "bitcoin honest opinion", "crypto facts vs myths",
+    "is bitcoin a scam debunked", "crypto not a scam", "crypto honest analysis",
+    "bitcoin not scam", "ethereum not scam", "crypto real review",
+
+    # Safety and awareness
+    "how to spot crypto scam", "crypto scam warning", "avoid crypto scam",
+    "crypto security tips", "crypto red flags", "protect crypto wallet",
+    "crypto scam awareness", "crypto safety guide",
+
+    # News and market updates
+    "crypto news today", "bitcoin news", "ethereum news",
+    "crypto market update", "bitcoin price analysis", "eth market analysis",
+    "crypto weekly recap", "blockchain news update",
+
+    # Legitimate finance / investing
+    "crypto investing guide", "bitcoin long term investment", "crypto portfolio tips",
+    "dollar cost averaging crypto", "crypto risk management",
+    "crypto tax explained", "crypto regulation news",
+]
+
+# ==================================================
+# KEYWORD SETS
+# ==================================================
+
+# Presence of ANY of these = likely legitimate/educational
+LEGIT_KEYWORDS = [
+    # Educational language
+    "explained", "tutorial", "how to", "guide", "learn", "education",
+    "beginner", "introduction", "basics", "overview", "course", "lesson",
+    "101", "what is", "deep dive", "understanding", "walkthrough",
+
+    # Analysis / news
+    "analysis", "review", "news", "update", "report", "summary",
+    "breakdown", "market", "trend", "price analysis", "weekly", "monthly",
+    "opinion", "thoughts", "honest", "real talk", "unbiased",
+
+    # Safety / awareness
+    "scam warning", "avoid scam", "scam alert", "protect yourself",
+    "security tips", "how to spot", "red flags", "be careful",
+    "scam awareness", "not a scam", "not scam", "legitimate", "legit",
+    "honest review", "honest opinion",
+
+    # Technical concepts (signals depth, not hype)
+    "blockchain", "defi", "web3", "smart contract", "proof of stake",
+    "proof of work", "wallet", "transaction", "gas fees", "layer 2",
+    "consensus", "decentralized", "open source", "whitepaper",
+
+    # Responsible investing language
+    "investing", "portfolio", "diversify", "risk management",
+    "dollar cost averaging", "dca", "hodl", "long term", "fundamentals",
+    "crypto tax", "regulation", "compliance", "institutional",
+]
+
+# Presence of ANY of these = likely a scam — exclude the video
+SCAM_EXCLUSION_KEYWORDS = [
+    "free bitcoin", "free crypto", "free eth", "free btc",
+    "double your bitcoin", "double your crypto", "triple your",
+    "multiply your crypto", "guaranteed profit", "guaranteed returns",
+    "can't lose", "risk free profit", "instant profit", "overnight profit",
+    "get rich quick", "make money fast", "easy money",
+    "bitcoin giveaway", "crypto giveaway", "eth giveaway",
+    "free airdrop", "claim free crypto", "claim free tokens",
+    "doubler", "bitcoin generator", "crypto generator",
+    "send btc get", "send eth get", "send crypto get",
+    "100% real working", "working 2024", "working 2025",
+    "elon musk giveaway", "vitalik giveaway",
+    "link in bio free", "dm me for profits",
+    "trading bot free profit", "automated crypto profit guaranteed",
+    "10x guaranteed", "1000x guaranteed", "moonshot guaranteed",
+]
+
+# Auto-classification: the first category with a matching keyword wins
+CATEGORY_KEYWORDS = [
+    ("Crypto News", ["news", "update", "today", "breaking", "weekly recap"]),
+    ("Crypto Education", ["tutorial", "explained", "how to", "guide", "beginner", "101", "learn", "course"]),
+    ("Crypto Analysis", ["analysis", "price", "market", "trend", "chart", "technical"]),
+    ("Scam Awareness", ["scam warning", "avoid scam", "red flags", "security", "protect", "safety"]),
+    ("Crypto Investing", ["investing", "portfolio", "dca", "long term", "tax", "regulation"]),
+]
+DEFAULT_CATEGORY = "Crypto General"
+
+INCLUDE_KEYWORDS = LEGIT_KEYWORDS
+EXCLUDE_KEYWORDS = SCAM_EXCLUSION_KEYWORDS
@@ -0,0 +1,129 @@
+"""
+Gift card "NOT SCAM" / legitimate profile.
+
+Targets educational, review-based, and awareness content about gift cards.
+"""
+
+import os
+
+TITLE = "YouTube Shorts Gift Card NOT SCAM / Legitimate Video Scraper"
+OUTPUT_DIR = os.path.join(os.path.expanduser("~"), "Desktop", "video_crawler_legit")
+DATASET = "youtube_shorts_giftcards_legit"
+LABEL = "NOT SCAM"
+CRITERIA = "legitimate content"         # shown when a video fails the filter
+
+TRACKING_FILE = os.path.join(
+    OUTPUT_DIR, "scraped_videos_index_youtube_shorts_giftcards_legit.json"
+)
+DATABASE_FILE = os.path.join(OUTPUT_DIR, "giftcards_not_scam.db")
+DOWNLOAD_QUEUE_FILE = os.path.join(OUTPUT_DIR, "download_queue_youtube_shorts_giftcards_legit.jsonl")
+FRONTIER_FILE = os.path.join(OUTPUT_DIR, "frontier_youtube_shorts_giftcards_legit.jsonl")
+PAGE_CACHE_FILE = os.path.join(OUTPUT_DIR, "page_cache_youtube_shorts_giftcards_legit.jsonl")
+CHANNELS_FILE = os.path.join(OUTPUT_DIR, "channels_youtube_shorts_giftcards_legit.jsonl")
+
+# YouTube Shorts legitimate gift card queries
+SEARCH_QUERIES = [
+    # How-to and tutorials
+    "how to use gift card", "how to redeem gift card", "gift card tutorial",
+    "how to buy gift card", "gift card explained", "gift card for beginners",
+    "how to check gift card balance", "gift card tips and tricks",
+    "how to use amazon gift card", "how to use google play gift card",
+    "how to use steam gift card", "how to use apple gift card",
+    "how to use visa gift card", "how to use mastercard gift card",
+    "how to use playstation gift card", "how to use xbox gift card",
+
+    # Honest reviews
+    "gift card honest review", "best gift cards 2024", "best gift cards 2025",
+    "gift card worth it", "gift card comparison", "gift card pros and cons",
+    "prepaid card review", "gift card vs cash", "digital gift card review",
+    "egift card review", "gift card unboxing",
+
+    # Safety and scam awareness
+    "gift card scam warning", "how to spot gift card scam", "avoid gift card scam",
+    "gift card fraud awareness", "gift card scam red flags", "gift card safety tips",
+    "protect yourself gift card scam", "gift card scam explained",
+    "irs gift card scam", "amazon gift card scam warning",
+    "google play gift card scam awareness", "gift card scam alert",
+    "never pay with gift card", "gift card scam not scam",
+
+    # Reselling and deals (legitimate secondary market)
+    "how to sell gift cards", "gift card resell tips", "gift card exchange guide",
+    "cardcash review", "raise gift card review", "gift card granny review",
+    "how to get discounted gift cards legitimately", "gift card deals tips",
+
+    # News and consumer information
+    "gift card news update", "gift card regulation", "gift card consumer rights",
+    "gift card expiration rules", "gift card fees explained",
+    "gift card fraud report", "gift card law explained",
+]
+
+# ==================================================
+# KEYWORD SETS
+# ==================================================
+
+# Presence of ANY of these = likely legitimate/educational
+LEGIT_KEYWORDS = [
+    # Educational language
+    "explained", "tutorial", "how to", "guide", "learn", "education",
+    "beginner", "introduction", "basics", "overview", "lesson",
+    "what is", "understanding", "walkthrough", "tips", "tricks",
+
+    # Review / comparison language
+    "review", "comparison", "honest", "pros and cons", "worth it",
+    "unboxing", "real talk", "unbiased", "opinion", "thoughts",
+    "best gift card", "top gift cards", "recommended",
+
+    # Redemption / legitimate use language
+    "redeem", "redemption", "balance check", "activate", "pin",
+    "how to use", "step by step", "instructions", "how to buy",
+    "purchase", "legitimate", "legit", "official",
+
+    # Safety / awareness
+    "scam warning", "avoid scam", "scam alert", "protect yourself",
+    "safety tips", "how to spot", "red flags", "be careful",
+    "scam awareness", "not a scam", "not scam", "fraud warning",
+    "consumer protection", "fraud prevention", "never pay with gift card",
+    "irs warning", "scam explained",
+
+    # Specific platforms (signals legitimate context)
+    "amazon gift card", "google play gift card", "apple gift card",
+    "steam gift card", "visa gift card", "mastercard gift card",
+    "playstation gift card", "xbox gift card", "netflix gift card",
+    "walmart gift card", "target gift card", "starbucks gift card",
+
+    # Reselling / deals (legitimate secondary market signals)
+    "cardcash", "raise.com", "gift card granny", "resell gift card",
+    "discounted gift card", "gift card exchange", "sell gift card",
+
+    # News / regulatory
+    "news", "update", "regulation", "consumer rights", "expiration",
+    "fees", "law", "policy", "report", "ftc", "consumer alert",
+]
+
+# Presence of ANY of these = likely a scam — exclude the video
+SCAM_EXCLUSION_KEYWORDS = [
+    "free gift card", "free amazon gift card", "free google play",
+    "free steam gift card", "free apple gift card", "free playstation",
+    "free xbox gift card", "free netflix gift card", "free walmart gift card",
+    "unlimited gift cards", "infinite gift cards", "gift card generator",
+    "gift card hack", "gift card glitch", "gift card exploit",
+    "free gift card codes", "gift card code generator", "working gift card codes",
+    "100% working gift card", "gift card method working",
+    "free robux gift card", "free v-bucks gift card", "free roblox gift card",
+    "gift card giveaway unlimited", "win unlimited gift cards",
+    "gift card trick free", "get free gift card fast",
+    "gift card cheat", "gift card loophole free",
+    "claim free gift card", "generate gift card codes free",
+    "working 2024 gift card", "working 2025 gift card",
+    "free gift card no survey", "gift card no verification free",
+    "earn unlimited gift cards", "gift card money glitch",
+    "100 dollar gift card free", "gift card instantly free",
+    "link in bio free gift", "dm me free gift card",
+]
+
+# Auto-classification: the first category with a matching keyword wins
+CATEGORY_KEYWORDS = []
+DEFAULT_CATEGORY = "Gift Card General"
+
+INCLUDE_KEYWORDS = LEGIT_KEYWORDS
+EXCLUDE_KEYWORDS = SCAM_EXCLUSION_KEYWORDS
@@ -0,0 +1,147 @@
+"""
+Product giveaway "SCAM" profile.
+
+Targets fake product giveaway scam content (iPhone, iPad, AirPods, etc.)
+for dataset labeling and classifier training.
+"""
+
+import os
+
+TITLE = "YouTube Shorts Product Giveaway SCAM Video Scraper"
+OUTPUT_DIR = os.path.join(os.path.expanduser("~"), "Desktop", "video_crawler_scam")
+DATASET = "youtube_shorts_crypto_scam"
+LABEL = "SCAM"
+CRITERIA = "scam content"               # shown when a video fails the filter
+
+TRACKING_FILE = os.path.join(
+    OUTPUT_DIR, "scraped_videos_index_youtube_shorts_product_scam.json"
+)
+DATABASE_FILE = os.path.join(OUTPUT_DIR, "product_scam.db")
+DOWNLOAD_QUEUE_FILE = os.path.join(OUTPUT_DIR, "download_queue_youtube_shorts_crypto_scam.jsonl")
+FRONTIER_FILE = os.path.join(OUTPUT_DIR, "frontier_youtube_shorts_crypto_scam.jsonl")
+PAGE_CACHE_FILE = os.path.join(OUTPUT_DIR, "page_cache_youtube_shorts_crypto_scam.jsonl")
+CHANNELS_FILE = os.path.join(OUTPUT_DIR, "channels_youtube_shorts_crypto_scam.jsonl")
+
+# YouTube Shorts product giveaway scam queries
+SEARCH_QUERIES = [
+    # iPhone giveaways
+    "free iPhone giveaway", "win free iPhone", "iPhone giveaway 2024",
+    "iPhone giveaway 2025", "iPhone 15 giveaway", "iPhone 16 giveaway",
+    "free iPhone 15", "free iPhone 16", "iPhone winner",
+    "claim free iPhone", "iPhone giveaway winner",
+
+    # iPad giveaways
+    "free iPad giveaway", "win free iPad", "iPad giveaway 2024",
+    "iPad giveaway 2025", "iPad Pro giveaway", "free iPad",
+    "claim free iPad", "iPad winner giveaway",
+
+    # AirPods giveaways
+    "free AirPods giveaway", "win AirPods", "AirPods giveaway 2024",
+    "AirPods giveaway 2025", "AirPods Pro giveaway", "free AirPods",
+    "claim free AirPods", "AirPods winner",
+
+    # Keyboard giveaways
+    "free keyboard giveaway", "win gaming keyboard", "keyboard giveaway",
+    "mechanical keyboard giveaway free", "free gaming keyboard",
+    "keyboard winner giveaway",
+
+    # Mouse giveaways
+    "free gaming mouse giveaway", "win gaming mouse", "mouse giveaway",
+    "free mouse giveaway", "gaming mouse giveaway winner",
+
+    # Headset / headphones giveaways
+    "free headset giveaway", "win gaming headset", "headset giveaway",
+    "free headphones giveaway", "AirPods Max giveaway free",
+    "Sony headphones giveaway", "free headphones winner",
+
+    # General tech / gadget giveaways
+    "free gadget giveaway", "win free tech", "free PS5 giveaway",
+    "free Xbox giveaway", "free Nintendo Switch giveaway",
+    "free Samsung giveaway", "free MacBook giveaway",
+    "free laptop giveaway", "win free laptop", "free smartwatch giveaway",
+    "free Apple Watch giveaway", "free gaming pc giveaway",
+
+    # Scam patterns — comment / like / follow bait
+    "like and win iPhone", "comment to win iPhone", "follow to win free iPhone",
+    "subscribe win iPhone", "like to win free gadget",
+    "comment win free AirPods", "follow win free headset",
+    "tag friend win iPhone", "share to win free tech",
+
+    # Fake prize / lottery
+    "you won iPhone", "you won free gadget", "claim your prize iPhone",
+    "free prize iPhone link bio", "dm to claim free iPhone",
+    "free gift iPhone", "gift card iPhone giveaway",
+]
+
+# ==================================================
+# KEYWORD SETS
+# ==================================================
+
+# Presence of ANY of these = likely a product giveaway scam — INCLUDE the video
+SCAM_KEYWORDS = [
+    # iPhone scam signals
+    "free iphone", "iphone giveaway", "win iphone", "claim iphone",
+    "iphone winner", "free iphone 15", "free iphone 16",
+
+    # iPad scam signals
+    "free ipad", "ipad giveaway", "win ipad", "claim ipad", "ipad winner",
+
+    # AirPods scam signals
+    "free airpods", "airpods giveaway", "win airpods", "claim airpods",
+    "airpods winner", "free airpods pro", "airpods max giveaway",
+
+    # Keyboard scam signals
+    "free keyboard", "keyboard giveaway", "win keyboard",
+    "free gaming keyboard", "claim keyboard",
+
+    # Mouse scam signals
+    "free mouse", "mouse giveaway", "win gaming mouse",
+    "free gaming mouse", "claim mouse",
+
+    # Headset / headphones scam signals
+    "free headset", "headset giveaway", "win headset",
+    "free headphones", "headphones giveaway", "win headphones",
+
+    # General tech giveaway scam signals
+    "free ps5", "ps5 giveaway", "free xbox", "xbox giveaway",
+    "free nintendo switch", "switch giveaway", "free macbook",
+    "macbook giveaway", "free laptop", "laptop giveaway",
+    "free samsung", "samsung giveaway", "free smartwatch",
+    "apple watch giveaway", "free gaming pc", "pc giveaway",
+    "free gadget", "gadget giveaway", "win free tech",
+
+    # Engagement-bait giveaway triggers
+    "like and win", "comment to win", "follow to win",
+    "subscribe win", "tag friend win", "share to win",
+    "like to win", "comment win free", "follow win free",
+
+    # Fake prize / lottery language
+    "you won", "claim your prize", "you have been selected",
+    "congratulations winner", "dm to claim", "link in bio free",
+    "free gift", "gift card giveaway", "claim free gift",
+    "working 2024", "working 2025", "100% real working",
+]
+
+# Presence of ANY of these = educational/legit — EXCLUDE the video
+LEGIT_EXCLUSION_KEYWORDS = [
+    "scam warning", "scam alert", "scam awareness", "avoid scam",
+    "how to spot scam", "protect yourself", "red flags",
+    "scam exposed", "scam explained", "scam analysis",
+    "educational", "tutorial", "explained", "how to",
+    "honest review", "unbiased", "honest opinion",
+    "analysis", "breakdown", "deep dive", "review",
+    "unboxing", "hands on", "first look",
+]
+
+# Auto-classification: the first category with a matching keyword wins
+CATEGORY_KEYWORDS = [
+    ("Crypto Giveaway", ["giveaway", "airdrop", "free bitcoin", "free crypto", "free eth"]),
+    ("Crypto Doubler", ["double", "triple", "multiply", "doubler", "multiplier", "send btc", "send eth"]),
+    ("Guaranteed Profit", ["guaranteed profit", "guaranteed returns", "risk free", "instant profit", "easy money", "get rich"]),
+    ("Celebrity Impersonation", ["elon musk", "vitalik", "binance giveaway", "coinbase giveaway", "musk"]),
+    ("Crypto Generator/Hack", ["generator", "hack", "adder", "bot", "working 2024", "working 2025"]),
+]
+DEFAULT_CATEGORY = "Crypto Scam General"
+
+INCLUDE_KEYWORDS = SCAM_KEYWORDS
+EXCLUDE_KEYWORDS = LEGIT_EXCLUSION_KEYWORDS
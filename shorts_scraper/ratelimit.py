@@ -0,0 +1,109 @@
+"""
+Rate limiting shared by the scraper worker threads.
+
+Each kind of request to YouTube (page loads, metadata, downloads) gets its
+own ``RateLimiter``: a token bucket holding up to ``burst`` tokens that
+refills at ``rate`` tokens per second. A call only sleeps when the bucket is
+empty, so idle time (a slow page, a rejected video) is not added on top of
+the budget.
+
+When YouTube pushes back (HTTP 429, the "confirm you're not a bot" check)
+``backoff`` halves the limiter's rate and pauses every caller for a cooldown
+that doubles while the throttling continues. The rate then climbs back to
+the configured one over ``recovery`` seconds.
+"""
+
+import time
+import threading
+
+# Markers of throttling in yt-dlp error messages and bot-check pages
+THROTTLE_MARKERS = (
+    "http error 429",
+    "too many requests",
+    "confirm you're not a bot",
+    "confirm you’re not a bot",
+    "unusual traffic",
+)
+MAX_COOLDOWN = 900.0      # longest pause after repeated throttling (seconds)
+
+
+class Throttled(Exception):
+    """YouTube answered with a rate-limit or bot-check response."""
+
+
+def is_throttled(error):
+    """Return True if ``error`` looks like a rate-limit / bot-check response."""
+    if isinstance(error, Throttled):
+        return True
+    message = str(error).lower()
+    return any(marker in message for marker in THROTTLE_MARKERS)
+
+
+class RateLimiter:
+    """Token bucket shared by all threads, with adaptive backoff.
+
+    ``rate`` is the average number of calls per second (0 or None disables
+    the limiter) and ``burst`` how many calls may go through back to back.
+    """
+
+    def __init__(self, rate, burst=1, name="requests", cooldown=30.0, recovery=300.0,
+                 min_fraction=1 / 16):
+        self.rate = rate or 0.0
+        self.burst = max(1, burst)
+        self.name = name
+        self.cooldown = cooldown
+        self.recovery = recovery
+        self.min_rate = self.rate * min_fraction
+        self.backoffs = 0
+        self._rate_now = self.rate
+        self._tokens = float(self.burst)
+        self._last = time.monotonic()
+        self._paused_until = 0.0
+        self._next_cooldown = cooldown
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        elapsed = now - self._last
+        self._last = now
+        if self._rate_now < self.rate:
+            self._rate_now = min(self.rate, self._rate_now + elapsed * self.rate / self.recovery)
+        self._tokens = min(self.burst, self._tokens + elapsed * self._rate_now)
+
+    def wait(self):
+        """Take a token, sleeping only as long as the bucket is empty or paused."""
+        if not self.rate:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1   # reserve; a negative balance is a queue of waiters
+            delay = -self._tokens / self._rate_now if self._tokens < 0 else 0.0
+            delay = max(delay, self._paused_until - now)
+        if delay > 0:
+            time.sleep(delay)
+
+    def backoff(self):
+        """Halve the rate and pause every caller after a throttled response."""
+        if not self.rate:
+            return
+        with self._lock:
+            now = time.monotonic()
+            if now < self._paused_until:
+                return   # already backing off from this burst of errors
+            self._refill(now)
+            if now - self._paused_until > self.recovery:
+                self._next_cooldown = self.cooldown   # quiet for a while: start over
+            cooldown = self._next_cooldown
+            self._next_cooldown = min(MAX_COOLDOWN, cooldown * 2)
+            self._rate_now = max(self.min_rate, self._rate_now / 2)
+            self._tokens = min(self._tokens, 0.0)
+            self._paused_until = now + cooldown
+            self.backoffs += 1
+            rate_now = self._rate_now
+        print(f"  ⚠ {self.name}: throttled by YouTube — pausing {cooldown:.0f}s, then {rate_now:.2f}/s")
+
+    def current_rate(self):
+        """Calls per second allowed right now (lower than ``rate`` after a backoff)."""
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._rate_now
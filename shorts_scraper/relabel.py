@@ -0,0 +1,217 @@
+"""
+Offline re-labeling of saved videos with the current keyword sets.
+
+Labels and categories are decided once, in ``extract_metadata``. After a
+keyword list changes, this command re-applies a profile's current filter and
+category rules to every saved record, from a ``metadata/<dataset>``
+directory or a video database, and writes back the new ``label`` /
+``category``. A record that no longer passes the filter gets ``label: null``.
+Every change goes to a JSON-lines diff report. In a database only the
+profile's own dataset is re-labeled, unless ``--dataset`` or
+``--all-datasets`` says otherwise.
+
+Records are streamed in batches to a process pool (one worker per CPU by
+default) with a bounded number of batches in flight, so memory use does not
+grow with the corpus.
+
+    python -m shorts_scraper.relabel --profile giveaway_scam \\
+        --metadata-dir metadata/youtube_shorts_crypto_scam --report relabel_diff.jsonl
+
+    python -m shorts_scraper.relabel --profile crypto_legit \\
+        --db crypto_not_scam.db --dataset youtube_shorts_crypto_legit --dry-run
+"""
+
+import os
+import json
+import argparse
+import itertools
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from shorts_scraper.workers import map_ordered
+from shorts_scraper.profiles import load_profile
+
+BATCH_SIZE = 500          # records per task sent to a worker process
+
+_profile = None           # per-process: the profile whose rules are applied
+
+
+def _init_worker(profile_name):
+    global _profile
+    _profile = load_profile(profile_name)
+
+
+def classify(title, description, tags):
+    """Return ``(label, category)`` for a record under the loaded profile."""
+    # Same text blob extract_metadata builds
+    # (index-only rows have no description or tags)
+    text_blob = f"{title or ''} {description or ''} {' '.join(tags or [])}"
+    matches = _profile.keywords.scan(text_blob)
+    if not _profile.accepts(text_blob, matches):
+        return None, None
+    return _profile.label, _profile.classify_category(text_blob, matches)
+
+
+def _relabel_files(paths, write):
+    """Worker: re-classify metadata files, rewriting the changed ones."""
+    changes = []
+    for path in paths:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+        except Exception as e:
+            changes.append({"source": path, "error": str(e)})
+            continue
+        label, category = classify(
+            meta.get("title", ""), meta.get("description", ""), meta.get("tags") or []
+        )
+        if label is None:
+            category = meta.get("category")
+        old = (meta.get("label"), meta.get("category"))
+        if old == (label, category):
+            continue
+        if write:
+            meta["label"], meta["category"] = label, category
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(meta, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        changes.append({
+            "video_id": meta.get("video_id"), "source": path,
+            "old_label": old[0], "new_label": label,
+            "old_category": old[1], "new_category": category,
+        })
+    return changes
+
+
+def _relabel_rows(rows):
+    """Worker: re-classify database rows; the caller writes the updates."""
+    changes = []
+    for video_id, title, description, tags, old_label, old_category in rows:
+        label, category = classify(title, description, tags)
+        if label is None:
+            category = old_category
+        if (old_label, old_category) != (label, category):
+            changes.append({
+                "video_id": video_id, "source": "db",
+                "old_label": old_label, "new_label": label,
+                "old_category": old_category, "new_category": category,
+            })
+    return changes
+
+
+def _batches(items, size):
+    items = iter(items)
+    while True:
+        batch = list(itertools.islice(items, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _metadata_files(metadata_dir):
+    with os.scandir(metadata_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(".json") and entry.is_file():
+                yield entry.path
+
+
+def relabel(profile_name, metadata_dir=None, store=None, dataset=None,
+            report_file=None, workers=None, dry_run=False, batch_size=BATCH_SIZE):
+    """Re-classify every record; return a Counter of (old, new) label/category pairs."""
+    workers = workers or os.cpu_count() or 1
+    transitions = Counter()
+    pool = ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(profile_name,)
+    )
+    report = open(report_file, "w", encoding="utf-8") if report_file else None
+    try:
+        if metadata_dir:
+            tasks = (
+                (_relabel_files, batch, not dry_run)
+                for batch in _batches(_metadata_files(metadata_dir), batch_size)
+            )
+        else:
+            tasks = (
+                (_relabel_rows, batch)
+                for batch in _batches(store.iter_records(dataset), batch_size)
+            )
+        # Two batches per worker in flight keeps the pool busy without buffering
+        for _, changes in map_ordered(_run_task, tasks, workers * 2, pool=pool):
+            for change in changes:
+                if "error" in change:
+                    transitions["unreadable"] += 1
+                else:
+                    transitions[(
+                        f"{change['old_label']} / {change['old_category']}",
+                        f"{change['new_label']} / {change['new_category']}",
+                    )] += 1
+                    if store is not None and not dry_run:
+                        store.set_label(
+                            change["video_id"], change["new_label"], change["new_category"]
+                        )
+                if report is not None:
+                    report.write(json.dumps(change, ensure_ascii=False) + "\n")
+        if store is not None:
+            store.flush()
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+        if report is not None:
+            report.close()
+    return transitions
+
+
+def _run_task(task):
+    func, *args = task
+    return func(*args)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Re-apply a profile's current keyword sets to saved videos."
+    )
+    parser.add_argument("--profile", required=True, help="profile holding the keyword sets")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--metadata-dir", help="metadata/<dataset> directory")
+    source.add_argument("--db", help="SQLite video database")
+    parser.add_argument(
+        "--dataset",
+        help="only re-label rows of this dataset (--db; default: the profile's dataset)",
+    )
+    parser.add_argument(
+        "--all-datasets", action="store_true",
+        help="re-label every row of the database with this profile's rules (--db)",
+    )
+    parser.add_argument("--report", help="write every change as JSON lines here")
+    parser.add_argument("--workers", type=int, help="worker processes (default: all CPUs)")
+    parser.add_argument("--dry-run", action="store_true", help="report changes only")
+    args = parser.parse_args()
+
+    profile = load_profile(args.profile)   # fail on an unknown name before starting workers
+    store = dataset = None
+    if args.db:
+        from shorts_scraper.store import VideoStore
+        # A shared database holds other datasets, whose labels this profile must not touch
+        dataset = None if args.all_datasets else args.dataset or profile.dataset
+        store = VideoStore(args.db, dataset=dataset)
+    try:
+        transitions = relabel(
+            args.profile, args.metadata_dir, store, dataset,
+            args.report, args.workers, args.dry_run,
+        )
+    finally:
+        if store is not None:
+            store.close()
+
+    total = sum(transitions.values())
+    verb = "would change" if args.dry_run else "changed"
+    print(f"✓ Re-labeling {verb} {total} records")
+    for transition, count in transitions.most_common():
+        if transition == "unreadable":
+            print(f"  {count:>8}  unreadable metadata files")
+        else:
+            print(f"  {count:>8}  {transition[0]}  →  {transition[1]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,439 @@
+"""
+SQLite storage backend for the Shorts scrapers.
+
+Keeps duplicate-tracking state and the full ``extract_metadata`` records in the
+``videos`` table used by ``crypto_not_scam.db`` (UNIQUE ``video_id`` plus the
+``downloaded`` / ``download_path`` columns), so duplicate checks, the
+"already downloaded" check and stats are indexed queries. ``VideoStore`` has the
+same ``is_duplicate`` / ``add_video`` / ``get_stats`` / ``close`` interface as
+``DuplicateTracker`` and can be dropped in for it.
+
+The database runs in WAL mode and writes are grouped into transactions of
+``batch_size`` statements. ``scraped_at`` is stored as ISO-8601 UTC, the
+format of the original rows, so MIN/MAX order by time.
+
+Duplicate checks go through a Bloom filter of the stored video ids first
+(``bloom.py``, saved as ``<db>.bloom``), so only the rare "maybe seen" ids
+cost a query and no per-video state is held in memory. The saved filter
+records the last row id it covers; rows added since, e.g. by another
+process, are read in when the store opens and again before it is saved.
+
+One-shot import of an existing JSON index and metadata directory:
+
+    python -m shorts_scraper.store --db videos.db \\
+        --index scraped_videos_index_youtube_shorts_crypto_legit.json \\
+        --metadata-dir metadata/youtube_shorts_crypto_legit \\
+        --videos-dir videos/youtube_shorts_crypto_legit \\
+        --dataset youtube_shorts_crypto_legit
+"""
+
+import os
+import json
+import glob
+import sqlite3
+import argparse
+import threading
+from datetime import datetime, timezone
+
+from shorts_scraper.bloom import BloomFilter
+from shorts_scraper.tracker import DuplicateTracker, extract_video_id
+
+BATCH_SIZE = 50           # writes per transaction
+FILTER_SUFFIX = ".bloom"  # membership filter saved next to the database
+
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS videos (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        video_id TEXT UNIQUE NOT NULL,
+        url TEXT NOT NULL,
+        title TEXT,
+        description TEXT,
+        channel_title TEXT,
+        published_at TEXT,
+        view_count INTEGER,
+        like_count INTEGER,
+        comment_count INTEGER,
+        tags TEXT,
+        label TEXT DEFAULT 'NOT SCAM',
+        scraped_at TEXT,
+        category TEXT DEFAULT 'Crypto'
+    )
+"""
+
+# Columns added on top of the original table (ALTERed in when missing)
+EXTRA_COLUMNS = {
+    "downloaded": "INTEGER DEFAULT 0",
+    "download_path": "TEXT",
+    "uploader": "TEXT",
+    "duration": "INTEGER",
+    "hashtags": "TEXT",
+    "dataset": "TEXT",
+    "metadata": "TEXT",
+}
+
+
+def _raw_id(video_id):
+    """Strip the ``youtube_`` prefix the scrapers put on ids."""
+    if video_id and video_id.startswith("youtube_"):
+        return video_id[len("youtube_"):]
+    return video_id
+
+
+def _utc_timestamp(value=None):
+    """ISO-8601 UTC form of a ``scraped_at`` value (now if empty).
+
+    Naive times such as the scrapers' ``"%Y-%m-%d %H:%M:%S"`` are local
+    time. A value that does not parse is kept as it is.
+    """
+    if not value:
+        return datetime.now(timezone.utc).isoformat()
+    try:
+        return datetime.fromisoformat(value).astimezone(timezone.utc).isoformat()
+    except (TypeError, ValueError):
+        return value
+
+
+class VideoStore:
+    """SQLite-backed duplicate index and metadata store."""
+
+    def __init__(self, db_path, dataset=None, batch_size=BATCH_SIZE):
+        self.db_path = db_path
+        self.dataset = dataset
+        self.batch_size = batch_size
+        self._pending = 0
+        self._lock = threading.RLock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self.conn = sqlite3.connect(
+            db_path, isolation_level=None, check_same_thread=False
+        )
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._migrate()
+        total = self.conn.execute("SELECT COUNT(*) FROM videos").fetchone()[0]
+        self.filter_file = db_path + FILTER_SUFFIX
+        self._load_filter()
+        print(f"✓ Opened video database ({total} videos): {db_path}")
+
+    def _migrate(self):
+        self.conn.execute(SCHEMA)
+        existing = {row[1] for row in self.conn.execute("PRAGMA table_info(videos)")}
+        for column, decl in EXTRA_COLUMNS.items():
+            if column not in existing:
+                self.conn.execute(f"ALTER TABLE videos ADD COLUMN {column} {decl}")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_videos_url ON videos(url)")
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_videos_dataset ON videos(dataset, downloaded)"
+        )
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_videos_scraped_at ON videos(scraped_at)"
+        )
+
+    # ----------------------------------------------
+    # Transactions
+    # ----------------------------------------------
+    def _write(self, sql, params=()):
+        """Run a write inside the current batch; return the affected row count."""
+        with self._lock:
+            if not self.conn.in_transaction:
+                self.conn.execute("BEGIN")
+            cur = self.conn.execute(sql, params)
+            self._pending += 1
+            if self._pending >= self.batch_size:
+                self.flush()
+            return cur.rowcount
+
+    def flush(self):
+        with self._lock:
+            if self.conn.in_transaction:
+                self.conn.execute("COMMIT")
+            self._pending = 0
+
+    def close(self):
+        with self._lock:
+            self.flush()
+            self._catch_up_filter()
+            self.filter.save(self.filter_file, self._filter_stamp)
+            self.conn.close()
+
+    # ----------------------------------------------
+    # Membership filter
+    # ----------------------------------------------
+    def _load_filter(self):
+        """Use the saved filter if it still fits the table, else rebuild it."""
+        bloom, stamp = BloomFilter.load(self.filter_file)
+        last_id = self.conn.execute("SELECT COALESCE(MAX(id), 0) FROM videos").fetchone()[0]
+        if bloom is None or stamp > last_id or bloom.count + (last_id - stamp) > bloom.capacity:
+            self._rebuild_filter()
+            return
+        self.filter = bloom
+        self._filter_stamp = stamp
+        self._catch_up_filter()
+
+    def _rebuild_filter(self):
+        """Build a filter with room for twice the stored ids from the table."""
+        with self._lock:
+            total = self.conn.execute("SELECT COUNT(*) FROM videos").fetchone()[0]
+            self.filter = BloomFilter(2 * total)
+            self._filter_stamp = 0
+            for row_id, video_id in self.conn.execute("SELECT id, video_id FROM videos"):
+                self.filter.add(video_id)
+                self._filter_stamp = max(self._filter_stamp, row_id)
+
+    def _catch_up_filter(self):
+        """Add rows inserted after the filter's stamp (by any process)."""
+        with self._lock:
+            for row_id, video_id in self.conn.execute(
+                "SELECT id, video_id FROM videos WHERE id > ? ORDER BY id",
+                (self._filter_stamp,),
+            ).fetchall():
+                if video_id not in self.filter:   # rows this store added are in already
+                    self._remember(video_id)
+                self._filter_stamp = row_id
+
+    def _remember(self, video_id):
+        with self._lock:
+            self.filter.add(video_id)
+            if self.filter.full():
+                self._rebuild_filter()
+
+    # ----------------------------------------------
+    # DuplicateTracker interface
+    # ----------------------------------------------
+    def is_duplicate(self, video_url, video_id=None):
+        ids = {i for i in (extract_video_id(video_url), _raw_id(video_id)) if i}
+        with self._lock:
+            if ids:
+                ids = [i for i in ids if i in self.filter]
+                if not ids:
+                    return False
+                marks = ",".join("?" * len(ids))
+                row = self.conn.execute(
+                    f"SELECT 1 FROM videos WHERE video_id IN ({marks}) LIMIT 1",
+                    tuple(ids),
+                ).fetchone()
+            else:
+                row = self.conn.execute(
+                    "SELECT 1 FROM videos WHERE url = ? LIMIT 1", (video_url,)
+                ).fetchone()
+        return row is not None
+
+    def known_ids(self, video_ids, chunk=500):
+        """Return the subset of bare ``video_ids`` already stored."""
+        known = set()
+        with self._lock:
+            video_ids = [i for i in video_ids if i in self.filter]
+            for i in range(0, len(video_ids), chunk):
+                part = video_ids[i:i + chunk]
+                marks = ",".join("?" * len(part))
+                known.update(
+                    row[0] for row in self.conn.execute(
+                        f"SELECT video_id FROM videos WHERE video_id IN ({marks})", part
+                    )
+                )
+        return known
+
+    def add_video(self, video_url, video_id, metadata=None):
+        metadata = metadata or {}
+        raw_id = _raw_id(video_id) or extract_video_id(video_url)
+        inserted = self._write(
+            "INSERT OR IGNORE INTO videos"
+            " (video_id, url, title, channel_title, uploader, scraped_at, dataset, label, category)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                raw_id,
+                f"https://www.youtube.com/shorts/{raw_id}",
+                metadata.get("title", ""),
+                metadata.get("channel", ""),
+                metadata.get("uploader", ""),
+                _utc_timestamp(metadata.get("scraped_at")),
+                self.dataset,
+                # Explicit, so index-only rows don't get the schema's defaults
+                metadata.get("label"),
+                metadata.get("category"),
+            ),
+        )
+        if inserted > 0:
+            self._remember(raw_id)
+
+    def get_stats(self):
+        # Separate queries: SQLite only answers a lone MIN or MAX from the index
+        with self._lock:
+            total = self.conn.execute("SELECT COUNT(*) FROM videos").fetchone()[0]
+            oldest = self.conn.execute("SELECT MIN(scraped_at) FROM videos").fetchone()[0]
+            newest = self.conn.execute("SELECT MAX(scraped_at) FROM videos").fetchone()[0]
+        return {"total_scraped": total, "oldest": oldest, "newest": newest}
+
+    # ----------------------------------------------
+    # Metadata / downloads
+    # ----------------------------------------------
+    def save_metadata(self, meta, dataset=None):
+        """Insert an ``extract_metadata`` record; return False if already stored."""
+        inserted = self._write(
+            "INSERT OR IGNORE INTO videos"
+            " (video_id, url, title, description, channel_title, published_at,"
+            "  view_count, like_count, comment_count, tags, label, scraped_at,"
+            "  category, uploader, duration, hashtags, dataset, metadata)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                _raw_id(meta["video_id"]),
+                meta.get("video_url"),
+                meta.get("title"),
+                meta.get("description"),
+                meta.get("channel"),
+                meta.get("upload_date"),
+                meta.get("view_count"),
+                meta.get("like_count"),
+                meta.get("comment_count"),
+                json.dumps(meta.get("tags") or [], ensure_ascii=False),
+                meta.get("label"),
+                _utc_timestamp(meta.get("scraped_at")),
+                meta.get("category"),
+                meta.get("uploader"),
+                meta.get("duration"),
+                json.dumps(meta.get("hashtags"), ensure_ascii=False),
+                dataset or self.dataset,
+                json.dumps(meta, ensure_ascii=False),
+            ),
+        )
+        if inserted > 0:
+            self._remember(_raw_id(meta["video_id"]))
+        return inserted > 0
+
+    def is_already_downloaded(self, video_id):
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT downloaded FROM videos WHERE video_id = ?",
+                (_raw_id(video_id),),
+            ).fetchone()
+        return bool(row and row[0])
+
+    def mark_downloaded(self, video_id, download_path, fetched=None):
+        """Record the file; ``fetched`` (the format actually downloaded) goes into metadata."""
+        if fetched is None:
+            self._write(
+                "UPDATE videos SET downloaded = 1, download_path = ? WHERE video_id = ?",
+                (download_path, _raw_id(video_id)),
+            )
+            return
+        self._write(
+            "UPDATE videos SET downloaded = 1, download_path = ?,"
+            " metadata = json_set(COALESCE(metadata, '{}'), '$.downloaded_format', json(?))"
+            " WHERE video_id = ?",
+            (download_path, json.dumps(fetched), _raw_id(video_id)),
+        )
+
+    def pending_downloads(self, dataset=None):
+        """Return ``[(video_id, url)]`` for saved videos not downloaded yet."""
+        dataset = dataset or self.dataset
+        with self._lock:
+            return self.conn.execute(
+                "SELECT video_id, url FROM videos WHERE dataset IS ? AND downloaded = 0"
+                " AND metadata IS NOT NULL ORDER BY id",
+                (dataset,),
+            ).fetchall()
+
+    # ----------------------------------------------
+    # Re-labeling
+    # ----------------------------------------------
+    def iter_records(self, dataset=None, page_size=1000):
+        """Yield ``(video_id, title, description, tags, label, category)`` rows.
+
+        Rows are read ``page_size`` at a time by primary key, so memory stays
+        flat however large the table is.
+        """
+        last_id = 0
+        where = "id > ?" + (" AND dataset = ?" if dataset else "")
+        while True:
+            params = (last_id, dataset) if dataset else (last_id,)
+            with self._lock:
+                rows = self.conn.execute(
+                    "SELECT id, video_id, title, description, tags, label, category"
+                    f" FROM videos WHERE {where} ORDER BY id LIMIT ?",
+                    params + (page_size,),
+                ).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                try:
+                    tags = json.loads(row[4]) if row[4] else []
+                except ValueError:
+                    tags = []
+                yield (row[1], row[2], row[3], tags, row[5], row[6])
+            last_id = rows[-1][0]
+
+    def set_label(self, video_id, label, category):
+        """Update a video's label and category (columns and stored metadata)."""
+        self._write(
+            "UPDATE videos SET label = ?, category = ?,"
+            " metadata = CASE WHEN metadata IS NULL THEN NULL"
+            "  ELSE json_set(metadata, '$.label', ?, '$.category', ?) END"
+            " WHERE video_id = ?",
+            (label, category, label, category, _raw_id(video_id)),
+        )
+
+
+# ==================================================
+# ONE-SHOT IMPORTER
+# ==================================================
+def import_json(store, index_file=None, metadata_dir=None, videos_dir=None):
+    """Copy a JSON index, a metadata directory and downloaded files into ``store``."""
+    counts = {"index": 0, "metadata": 0, "downloaded": 0}
+    if metadata_dir:
+        for path in sorted(glob.glob(os.path.join(metadata_dir, "*.json"))):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    meta = json.load(f)
+            except Exception as e:
+                print(f"⚠ Skipping unreadable metadata file {path}: {e}")
+                continue
+            if store.save_metadata(meta, meta.get("dataset")):
+                counts["metadata"] += 1
+
+    if index_file:
+        # DuplicateTracker also replays a pending journal next to the index
+        tracker = DuplicateTracker(index_file)
+        for url, entry in tracker.scraped_videos.items():
+            if not store.is_duplicate(url, entry.video_id):
+                store.add_video(url, entry.video_id, entry.to_dict())
+                counts["index"] += 1
+
+    if videos_dir:
+        for path in sorted(
+            glob.glob(os.path.join(videos_dir, "*.mp4"))
+            + glob.glob(os.path.join(videos_dir, "*.m4a"))
+        ):
+            video_id = os.path.splitext(os.path.basename(path))[0]
+            if store.is_duplicate("", video_id):
+                store.mark_downloaded(video_id, path)
+                counts["downloaded"] += 1
+
+    store.flush()
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Import JSON indexes and metadata directories into a video database."
+    )
+    parser.add_argument("--db", required=True, help="SQLite database to write")
+    parser.add_argument("--index", help="scraped_videos_index_*.json file")
+    parser.add_argument("--metadata-dir", help="metadata/<dataset> directory")
+    parser.add_argument("--videos-dir", help="videos/<dataset> directory")
+    parser.add_argument("--dataset", help="dataset name stored with imported rows")
+    args = parser.parse_args()
+
+    store = VideoStore(args.db, dataset=args.dataset)
+    try:
+        counts = import_json(store, args.index, args.metadata_dir, args.videos_dir)
+    finally:
+        store.close()
+    print(
+        f"✓ Imported {counts['metadata']} metadata records,"
+        f" {counts['index']} index-only entries,"
+        f" {counts['downloaded']} downloaded videos"
+    )
+
+
+if __name__ == "__main__":
+    main()
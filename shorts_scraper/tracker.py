@@ -0,0 +1,342 @@
+"""
+Duplicate tracking for the Shorts scrapers.
+
+The index lives in two files: a JSON snapshot (the same format the scrapers
+have always written) and an append-only journal with one JSON line per added
+video. Adds only touch the journal; once it holds ``compact_every`` entries and
+half as many as the snapshot, it is folded into a fresh snapshot that replaces
+the old one atomically, so rewrites stay amortised O(1) per add however large
+the index grows. Loading replays snapshot + journal, and a torn last journal
+line is dropped, so a crash mid-write never corrupts the index.
+
+Entries are keyed by their canonical /shorts/ URL, which also answers lookups
+by video id; only ids stored under some other URL get a second mapping.
+For very large histories use the SQLite backend (``store.py``), which keeps
+nothing per video in memory.
+
+In memory each entry is an ``IndexEntry``: a ``__slots__`` record with the
+scrape time packed into an integer (other time formats, e.g. ISO-8601 from
+imported data, are kept as given) and channel / uploader names interned,
+since one channel has many videos. The oldest and newest scrape times are
+kept up to date as entries are added, so ``get_stats`` does not walk the
+index.
+"""
+
+import os
+import re
+import sys
+import json
+import time
+from datetime import datetime
+
+JOURNAL_SUFFIX = ".journal"
+COMPACT_EVERY = 500       # min journal entries before folding into the snapshot
+
+SHORTS_URL = "https://www.youtube.com/shorts/"
+
+_SHORTS_ID = re.compile(r"/shorts/([a-zA-Z0-9_-]+)")
+_WATCH_ID = re.compile(r"[?&]v=([a-zA-Z0-9_-]+)")
+
+
+def normalize_url(url):
+    """Return ``(canonical_url, video_id)`` for a YouTube link.
+
+    /shorts/ID and watch?v=ID links both map to ``SHORTS_URL + ID``; a link
+    without an id keeps its path with the query string cut off and has id
+    None.
+    """
+    # Nearly every discovered link is a /shorts/ one: one search settles it
+    match = _SHORTS_ID.search(url) or _WATCH_ID.search(url)
+    if match is None:
+        return url.split("?")[0].split("&")[0], None
+    video_id = match.group(1)
+    return SHORTS_URL + video_id, video_id
+
+
+def normalize_many(urls):
+    """Canonicalise a batch of links: ``[(canonical_url, video_id)]`` in input order.
+
+    ``dict(normalize_many(urls))`` drops repeats, so /shorts/ID and
+    watch?v=ID links of the same video collapse into one entry.
+    """
+    pairs = []
+    append, shorts_id = pairs.append, _SHORTS_ID.search
+    for url in urls:
+        match = shorts_id(url)
+        if match is None:
+            append(normalize_url(url))
+        else:
+            video_id = match.group(1)
+            append((SHORTS_URL + video_id, video_id))
+    return pairs
+
+
+def extract_video_id(url):
+    """Return the bare YouTube id in a /shorts/ or watch?v= URL, or None."""
+    return normalize_url(url)[1]
+
+
+def _shorts_url(video_id):
+    """Canonical URL for a bare or ``youtube_``-prefixed video id."""
+    if video_id.startswith("youtube_"):
+        video_id = video_id[len("youtube_"):]
+    return SHORTS_URL + video_id
+
+
+def _pack_time(text):
+    """``"2025-01-31 12:00:00"`` -> ``20250131120000``; any other value is returned as is."""
+    if not isinstance(text, str) or len(text) != 19:
+        return text
+    digits = text.replace("-", "").replace(" ", "").replace(":", "")
+    if len(digits) != 14 or not digits.isdigit():
+        return text
+    packed = int(digits)
+    return packed if _unpack_time(packed) == text else text
+
+
+def _unpack_time(packed):
+    if not isinstance(packed, int):
+        return packed
+    date, clock = divmod(packed, 1_000_000)
+    return (
+        f"{date // 10000:04d}-{date // 100 % 100:02d}-{date % 100:02d}"
+        f" {clock // 10000:02d}:{clock // 100 % 100:02d}:{clock % 100:02d}"
+    )
+
+
+def _time_key(scraped_at):
+    """Packed local time for ordering a stored ``scraped_at``; None if unknown."""
+    if isinstance(scraped_at, int):
+        return scraped_at
+    try:
+        when = datetime.fromisoformat(scraped_at)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is not None:
+        when = when.astimezone().replace(tzinfo=None)
+    return int(when.strftime("%Y%m%d%H%M%S"))
+
+
+class IndexEntry:
+    """One index entry; ``to_dict`` gives the snapshot / journal form."""
+
+    __slots__ = ("video_id", "scraped_at", "title", "uploader", "channel")
+
+    def __init__(self, video_id, scraped_at, title="", uploader="", channel=""):
+        self.video_id = video_id
+        self.scraped_at = scraped_at   # packed YYYYMMDDhhmmss, or the original value
+        self.title = title
+        self.uploader = sys.intern(uploader) if uploader else ""
+        self.channel = sys.intern(channel) if channel else ""
+
+    @classmethod
+    def from_dict(cls, entry):
+        return cls(
+            entry.get("video_id"), _pack_time(entry.get("scraped_at")),
+            entry.get("title") or "", entry.get("uploader") or "", entry.get("channel") or "",
+        )
+
+    def to_dict(self):
+        return {
+            "video_id": self.video_id,
+            "scraped_at": _unpack_time(self.scraped_at),
+            "title": self.title,
+            "uploader": self.uploader,
+            "channel": self.channel,
+        }
+
+
+def _entry_hook(obj):
+    """``json.load`` hook turning index entries into ``IndexEntry`` as they are parsed."""
+    return IndexEntry.from_dict(obj) if "scraped_at" in obj or "video_id" in obj else obj
+
+
+class DuplicateTracker:
+    """Manages tracking of already-scraped videos to prevent duplicates."""
+
+    def __init__(self, tracking_file, compact_every=COMPACT_EVERY):
+        self.tracking_file = tracking_file
+        self.journal_file = tracking_file + JOURNAL_SUFFIX
+        self.compact_every = compact_every
+        self._journal = None
+        self._journal_entries = 0
+        self.video_ids = {}   # video_id -> URL, for ids not stored under their /shorts/ URL
+        self._oldest = self._newest = None   # (time key, scraped_at) of the extremes
+        self.scraped_videos = self._load_index()
+        if self._compaction_due():
+            self.compact()
+
+    # ----------------------------------------------
+    # Persistence
+    # ----------------------------------------------
+    def _load_index(self):
+        data = {}
+        if os.path.exists(self.tracking_file):
+            try:
+                with open(self.tracking_file, "r", encoding="utf-8") as f:
+                    data = json.load(f, object_hook=_entry_hook)
+            except Exception as e:
+                print(f"⚠ Error loading index, starting fresh: {e}")
+                data = {}
+
+        replayed = self._replay_journal(data)
+        self.video_ids = {
+            v.video_id: url for url, v in data.items()
+            if v.video_id and url != _shorts_url(v.video_id)
+        }
+        self._reset_bounds(data.values())
+        if data:
+            suffix = f" ({replayed} from journal)" if replayed else ""
+            print(f"✓ Loaded {len(data)} previously scraped videos from index{suffix}")
+        else:
+            print("✓ Starting new video index")
+        return data
+
+    def _replay_journal(self, data):
+        """Apply journal entries on top of ``data``; truncate a torn tail."""
+        if not os.path.exists(self.journal_file):
+            return 0
+        replayed = 0
+        good_offset = 0
+        try:
+            with open(self.journal_file, "rb") as f:
+                for raw in f:
+                    if not raw.endswith(b"\n"):
+                        break
+                    try:
+                        record = json.loads(raw)
+                        data[record["url"]] = IndexEntry.from_dict(record["entry"])
+                    except (ValueError, KeyError, TypeError):
+                        break
+                    replayed += 1
+                    good_offset += len(raw)
+            if good_offset != os.path.getsize(self.journal_file):
+                print("⚠ Dropping incomplete trailing journal entry")
+                with open(self.journal_file, "r+b") as f:
+                    f.truncate(good_offset)
+        except Exception as e:
+            print(f"⚠ Error replaying index journal: {e}")
+        self._journal_entries = replayed
+        return replayed
+
+    def _append_journal(self, url, entry):
+        try:
+            if self._journal is None:
+                os.makedirs(os.path.dirname(self.journal_file) or ".", exist_ok=True)
+                self._journal = open(self.journal_file, "a", encoding="utf-8")
+            line = json.dumps({"url": url, "entry": entry.to_dict()}, ensure_ascii=False)
+            self._journal.write(line + "\n")
+            self._journal.flush()
+            self._journal_entries += 1
+        except Exception as e:
+            print(f"⚠ Error writing index journal: {e}")
+            return
+        if self._compaction_due():
+            self.compact()
+
+    def _compaction_due(self):
+        # Scaled with the snapshot, so its rewrite costs O(1) per add
+        return self._journal_entries >= max(self.compact_every, len(self.scraped_videos) // 2)
+
+    def _save_index(self):
+        """Atomically replace the snapshot with the in-memory index."""
+        tmp_path = self.tracking_file + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(self.tracking_file) or ".", exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    self.scraped_videos, f, indent=2, ensure_ascii=False,
+                    default=IndexEntry.to_dict,
+                )
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.tracking_file)
+            return True
+        except Exception as e:
+            print(f"⚠ Error saving index: {e}")
+            return False
+
+    def compact(self):
+        """Fold the journal into a new snapshot and start an empty journal."""
+        if not self._save_index():
+            return
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+        try:
+            # Replaying a stale journal over the new snapshot is harmless, so a
+            # crash between the replace above and this truncate loses nothing.
+            open(self.journal_file, "w").close()
+        except Exception as e:
+            print(f"⚠ Error truncating index journal: {e}")
+        self._journal_entries = 0
+
+    def flush(self):
+        """Push journalled adds to disk (each line is already flushed when written)."""
+        if self._journal is not None:
+            self._journal.flush()
+
+    def close(self):
+        # The journal is replayed on load, so there is nothing to fold in here
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+    # ----------------------------------------------
+    # Lookups
+    # ----------------------------------------------
+    def _normalize_youtube_url(self, url):
+        return normalize_url(url)[0]
+
+    def is_duplicate(self, video_url, video_id=None):
+        normalized_url = normalize_url(video_url)[0]
+        if normalized_url in self.scraped_videos:
+            return True
+        return bool(video_id) and (
+            _shorts_url(video_id) in self.scraped_videos or video_id in self.video_ids
+        )
+
+    def known_ids(self, video_ids):
+        """Return the subset of bare ``video_ids`` already in the index."""
+        return {
+            video_id for video_id in video_ids
+            if SHORTS_URL + video_id in self.scraped_videos
+            or f"youtube_{video_id}" in self.video_ids
+        }
+
+    def add_video(self, video_url, video_id, metadata=None):
+        normalized_url = normalize_url(video_url)[0]
+        metadata = metadata or {}
+        entry = IndexEntry(
+            video_id,
+            _pack_time(time.strftime("%Y-%m-%d %H:%M:%S")),
+            metadata.get("title") or "",
+            metadata.get("uploader") or "",
+            metadata.get("channel") or "",
+        )
+        self.scraped_videos[normalized_url] = entry
+        self._extend_bounds(entry.scraped_at)
+        if video_id and normalized_url != _shorts_url(video_id):
+            self.video_ids[video_id] = normalized_url
+        self._append_journal(normalized_url, entry)
+
+    def get_stats(self):
+        return {
+            "total_scraped": len(self.scraped_videos),
+            "oldest": _unpack_time(self._oldest[1]) if self._oldest else None,
+            "newest": _unpack_time(self._newest[1]) if self._newest else None,
+        }
+
+    def _reset_bounds(self, entries):
+        self._oldest = self._newest = None
+        for entry in entries:
+            self._extend_bounds(entry.scraped_at)
+
+    def _extend_bounds(self, scraped_at):
+        key = _time_key(scraped_at)
+        if key is None:
+            return
+        if self._oldest is None or key < self._oldest[0]:
+            self._oldest = (key, scraped_at)
+        if self._newest is None or key > self._newest[0]:
+            self._newest = (key, scraped_at)
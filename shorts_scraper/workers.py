@@ -0,0 +1,43 @@
+"""
+Worker pools for the network-bound scraper stages.
+"""
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+
+def _call(func, item, limiter):
+    if limiter is not None:
+        limiter.wait()
+    return func(item)
+
+
+def map_ordered(func, items, workers=4, limiter=None, pool=None):
+    """Run ``func`` over ``items`` on a thread pool, yielding ``(item, result)`` in input order.
+
+    At most ``workers`` calls are queued ahead of the consumer, and every call
+    first waits on the shared ``limiter``. Stopping iteration early cancels the
+    calls that have not started yet, so a consumer that stops at a quota wastes
+    no more than ``workers`` calls.
+
+    Pass a long-lived ``pool`` to keep the same worker threads (and their
+    per-thread state) across calls; otherwise a private pool is used.
+    """
+    pending = deque()
+    own_pool = pool is None
+    if own_pool:
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scraper")
+    try:
+        for item in items:
+            pending.append((item, pool.submit(_call, func, item, limiter)))
+            if len(pending) >= workers:
+                item_done, future = pending.popleft()
+                yield item_done, future.result()
+        while pending:
+            item_done, future = pending.popleft()
+            yield item_done, future.result()
+    finally:
+        for _, future in pending:
+            future.cancel()
+        if own_pool:
+            pool.shutdown(wait=True, cancel_futures=True)
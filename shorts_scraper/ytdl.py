@@ -0,0 +1,126 @@
+"""
+Long-lived yt-dlp instances, one per worker thread and purpose.
+
+Building a ``yt_dlp.YoutubeDL`` repeats option processing, extractor setup and
+HTTP session creation, so each thread keeps one instance per name (e.g. one for
+metadata, one for downloads) and reuses it for every video. ``YoutubeDL`` is
+not thread-safe, which is why instances are never shared between threads.
+"""
+
+import threading
+
+import yt_dlp
+
+_local = threading.local()
+_all_instances = []
+_registry_lock = threading.Lock()
+
+
+def get_ydl(name, opts):
+    """Return this thread's ``YoutubeDL`` for ``name``, creating it on first use."""
+    instances = getattr(_local, "instances", None)
+    if instances is None:
+        instances = _local.instances = {}
+    ydl = instances.get(name)
+    if ydl is None:
+        ydl = instances[name] = yt_dlp.YoutubeDL(dict(opts))
+        with _registry_lock:
+            _all_instances.append(ydl)
+    return ydl
+
+
+def close_all():
+    """Close every instance created so far (call once the worker pools are done)."""
+    with _registry_lock:
+        instances, _all_instances[:] = list(_all_instances), []
+    for ydl in instances:
+        try:
+            ydl.close()
+        except Exception:
+            pass
+
+
+# ==================================================
+# METADATA-ONLY EXTRACTION
+# ==================================================
+# Skip the DASH/HLS manifests and the player JS used for signature decryption:
+# none of it is needed for title/description/tags/duration/counts/live flags.
+# extract_info(..., process=False) additionally skips format sorting and
+# selection. Format resolution happens later, in download_video.
+METADATA_ONLY_OPTS = {
+    "quiet": True,
+    "skip_download": True,
+    "no_warnings": True,
+    "extractor_args": {"youtube": {"skip": ["dash", "hls"], "player_skip": ["js"]}},
+}
+FULL_METADATA_OPTS = {"quiet": True, "skip_download": True, "no_warnings": True}
+
+
+def fetch_info(url, metadata_only=True):
+    """Return the yt-dlp info dict for ``url`` without downloading anything."""
+    if not metadata_only:
+        return get_ydl("metadata", FULL_METADATA_OPTS).extract_info(url, download=False)
+
+    info = get_ydl("metadata-only", METADATA_ONLY_OPTS).extract_info(
+        url, download=False, process=False
+    )
+    if info.get("_type") in ("url", "url_transparent"):
+        # Unresolved redirect (unusual for video URLs): let yt-dlp follow it
+        return fetch_info(url, metadata_only=False)
+    # is_live / was_live are normally filled in during processing
+    live_status = info.get("live_status")
+    info.setdefault("is_live", live_status == "is_live")
+    info.setdefault("was_live", live_status in ("was_live", "post_live"))
+    return info
+
+
+# ==================================================
+# DOWNLOAD FORMATS
+# ==================================================
+# What download_video asks yt-dlp for. The classifier scales frames down to
+# well below 480p, so "best" (largest video + audio streams, then an ffmpeg
+# merge) mostly buys bytes and CPU. The other formats fetch one ready-made
+# file and skip the merge. Every alternative in a "format" string keeps the
+# same container, so the file name (youtube_<id>.<ext>) is known up front.
+DOWNLOAD_FORMATS = {
+    # Original behaviour: best streams merged into an mp4
+    "best": {"format": "bestvideo+bestaudio/best", "merge_output_format": "mp4", "ext": "mp4"},
+    # Progressive (video + audio in one file) mp4 up to 480p
+    "480p": {
+        "format": "best[height<=480][ext=mp4][vcodec!=none][acodec!=none]"
+                  "/worst[ext=mp4][vcodec!=none][acodec!=none]",
+        "ext": "mp4",
+    },
+    # Video stream only, up to 480p
+    "480p-video": {
+        "format": "bestvideo[height<=480][ext=mp4]/worstvideo[ext=mp4]",
+        "ext": "mp4",
+    },
+    # Audio stream only
+    "audio": {"format": "bestaudio[ext=m4a]/worstaudio[ext=m4a]", "ext": "m4a"},
+}
+
+
+def fetched_format(info):
+    """``{"format_id", "height", "ext"}`` of what a download actually fetched.
+
+    ``info`` is what ``extract_info(url, download=True)`` returned; for a
+    merged download the format id joins the streams' ids (``"137+140"``).
+    """
+    return {
+        "format_id": info.get("format_id"),
+        "height": info.get("height"),
+        "ext": info.get("ext"),
+    }
+
+
+def download_opts(format_name):
+    """Return the yt-dlp options for a ``DOWNLOAD_FORMATS`` entry."""
+    try:
+        spec = DOWNLOAD_FORMATS[format_name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown download format {format_name!r}"
+            f" (available: {', '.join(DOWNLOAD_FORMATS)})"
+        ) from None
+    return {key: value for key, value in spec.items() if key != "ext"}
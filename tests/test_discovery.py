@@ -0,0 +1,35 @@
+from shorts_scraper.discovery import LINKS_SCRIPT, scroll_results
+
+
+class ScrollingPage:
+    """A results page that loads ten more links per scroll."""
+
+    def __init__(self):
+        self.links = 10
+        self.scrolls = 0
+
+    def execute_script(self, script):
+        if script == LINKS_SCRIPT:
+            return [f"https://www.youtube.com/shorts/v{i}" for i in range(self.links)]
+        if script.startswith("window.scrollBy"):
+            self.scrolls += 1
+            self.links += 10
+            return None
+        return [self.links, self.links * 100]
+
+
+def test_stops_once_enough_links_are_new():
+    seen = {f"https://www.youtube.com/shorts/v{i}" for i in range(20)}
+    page = ScrollingPage()
+    count = scroll_results(
+        page, 15, 3, 1, wanted=15,
+        count_new=lambda hrefs: sum(1 for h in hrefs if h not in seen),
+    )
+    # The 20 links seen before don't count toward the 15 wanted
+    assert count == 40 and page.scrolls == 3
+
+
+def test_without_count_new_scrolls_until_the_round_limit():
+    page = ScrollingPage()
+    assert scroll_results(page, 4, 3, 1, wanted=5) == 50
+    assert page.scrolls == 4
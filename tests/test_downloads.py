@@ -0,0 +1,43 @@
+import threading
+
+from shorts_scraper.downloads import DownloadQueue
+
+
+class State:
+    def __init__(self):
+        self.done_ids = []
+
+    def add(self, video_id, url):
+        pass
+
+    def done(self, video_id, path):
+        self.done_ids.append(video_id)
+
+
+def test_resume_does_not_block_on_a_backlog_longer_than_the_queue():
+    release = threading.Event()
+
+    def download(url, video_id, target, source):
+        release.wait()
+        return f"/videos/{video_id}.mp4"
+
+    state = State()
+    downloads = DownloadQueue(download, workers=1, max_pending=2)
+    downloads.resume((f"url{i}", f"id{i}", [("profile", state)]) for i in range(10))
+    assert downloads.backlog() >= 8   # returned while the jobs are still waiting
+    release.set()
+    downloads.close(wait=True)
+    assert sorted(state.done_ids) == sorted(f"id{i}" for i in range(10))
+    assert downloads.downloaded == 10 and downloads.backlog() == 0
+
+
+def test_close_without_wait_stops_feeding_resumed_jobs():
+    release = threading.Event()
+    state = State()
+    downloads = DownloadQueue(
+        lambda *args: release.wait() and "/videos/x.mp4", workers=1, max_pending=2
+    )
+    downloads.resume((f"url{i}", f"id{i}", [("profile", state)]) for i in range(10))
+    threading.Timer(0.2, release.set).start()
+    downloads.close(wait=False)
+    assert downloads.downloaded < 10
@@ -0,0 +1,75 @@
+import os
+
+import pytest
+
+pytest.importorskip("selenium")
+pytest.importorskip("yt_dlp")
+
+from shorts_scraper import engine
+from shorts_scraper.profiles import load_profile
+from shorts_scraper.ratelimit import Throttled
+from shorts_scraper.tracker import DuplicateTracker
+
+
+class FakeDriver:
+    current_url = ""
+
+    def get(self, url):
+        pass
+
+    def execute_script(self, script):
+        return 1
+
+    def quit(self):
+        pass
+
+
+@pytest.fixture
+def profile(tmp_path):
+    profile = load_profile("crypto_legit")
+    profile.output_dir = str(tmp_path)
+    profile.search_queries = ["bitcoin explained"]
+    for attr, name in [
+        ("tracking_file", "index.json"), ("database_file", "videos.db"),
+        ("download_queue_file", "downloads.jsonl"), ("frontier_file", "frontier.jsonl"),
+        ("page_cache_file", "pages.jsonl"), ("channels_file", "channels.jsonl"),
+    ]:
+        setattr(profile, attr, os.path.join(str(tmp_path), name))
+    return profile
+
+
+@pytest.fixture
+def offline(monkeypatch):
+    """Run ``crawl`` without a browser, network or sleeps."""
+    for name, value in [
+        ("MAX_VIDEOS", 1), ("DISCOVERY_SESSIONS", 1), ("STORAGE_BACKEND", "json"),
+        ("DOWNLOAD_VIDEOS", False), ("RESUME_FRONTIER", False), ("PAGE_CACHE_TTL", 0),
+        ("PAGE_LOAD_RATE", 0), ("METADATA_RATE", 0),
+    ]:
+        monkeypatch.setattr(engine, name, value)
+    monkeypatch.setattr(engine, "setup_driver", lambda *args: FakeDriver())
+    monkeypatch.setattr(engine.time, "sleep", lambda seconds: None)
+    monkeypatch.setattr(engine, "fetch_info", lambda url, metadata_only=True: {
+        "id": url.rsplit("/", 1)[1], "title": "bitcoin explained", "description": "",
+        "tags": [], "duration": 30, "view_count": 100_000,
+        "channel": "Crypto Basics", "channel_id": "UCbasics",
+    })
+
+
+def test_throttled_last_page_is_retried(profile, offline, monkeypatch):
+    calls = []
+
+    def discover(driver, url, rounds=None, wanted=None, count_new=None):
+        calls.append(url)
+        if len(calls) == 1:
+            raise Throttled("bot check")
+        return [{"url": "https://www.youtube.com/shorts/abc123", "video_id": "abc123",
+                 "title": "", "max_views": None}]
+
+    monkeypatch.setattr(engine, "discover_video_links", discover)
+    engine.crawl([profile])
+
+    assert len(calls) == 2 and calls[0] == calls[1]
+    assert DuplicateTracker(profile.tracking_file).is_duplicate(
+        "https://www.youtube.com/shorts/abc123"
+    )
@@ -0,0 +1,47 @@
+from shorts_scraper.frontier import FrontierLog
+from shorts_scraper.journal import AppendLog
+
+
+def test_torn_last_line_is_dropped_on_rewrite(tmp_path):
+    path = tmp_path / "log.jsonl"
+    path.write_text('{"n": 1}\n{"n": 2}\n{"n": 3')
+    log = AppendLog(str(path), "test log")
+    records = list(log.records())
+    assert records == [{"n": 1}, {"n": 2}]
+    log.rewrite(records)
+    log.append({"n": 4})
+    log.close()
+    assert list(AppendLog(str(path), "test log").records()) == [{"n": 1}, {"n": 2}, {"n": 4}]
+
+
+def test_frontier_log_resumes_pending_pages(tmp_path):
+    path = str(tmp_path / "frontier.jsonl")
+    log = FrontierLog(path)
+    log.queue("page1")
+    log.queue("page2")
+    log.checkpoint("page1", ["abc", "https://www.youtube.com/shorts/def"], finished=True)
+    log.close()
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"done": "pa')   # crash mid-append
+
+    log = FrontierLog(path)
+    assert list(log.pending) == ["page2"]
+    assert log.done == {"page1"}
+    assert log.visited == {"abc", "def"}
+    log.close()
+
+
+def test_frontier_rechecks_temporary_rejects_next_pass(tmp_path):
+    path = str(tmp_path / "frontier.jsonl")
+    log = FrontierLog(path)
+    log.queue("page1")
+    log.checkpoint("page1", ["kept", "low_views"], recheck={"low_views"})
+    log.close()
+
+    log = FrontierLog(path)
+    assert log.visited == {"kept"} and log.recheck == {"low_views"}
+    log.restart()
+    log.close()
+    log = FrontierLog(path)
+    assert log.visited == {"kept"} and not log.recheck
+    log.close()
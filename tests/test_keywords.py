@@ -0,0 +1,33 @@
+import pytest
+
+from shorts_scraper import keywords
+from shorts_scraper.keywords import KeywordMatcher
+
+LISTS = {
+    "include": ["giveaway", "free iphone", "give"],
+    "exclude": ["scam alert", "tutorial"],
+    "category:Phones": ["iphone", "samsung"],
+}
+TEXTS = ["FREE iPhone GIVEAWAY today", "scam alert: tutorial", "nothing here", ""]
+
+
+def expected(text):
+    t = text.lower()
+    return {name: {k for k in words if k in t} for name, words in LISTS.items()} if text \
+        else {name: set() for name in LISTS}
+
+
+@pytest.mark.parametrize("automaton", [True, False])
+def test_scan_returns_every_keyword_per_list(monkeypatch, automaton):
+    if automaton and keywords.ahocorasick is None:
+        pytest.skip("pyahocorasick not installed")
+    if not automaton:
+        monkeypatch.setattr(keywords, "ahocorasick", None)
+    matcher = KeywordMatcher(LISTS)
+    for text in TEXTS:
+        # Truth-testing first: the fallback short-circuits it
+        assert {name: bool(hits) for name, hits in matcher.scan(text).items()} == \
+            {name: bool(hits) for name, hits in expected(text).items()}
+        found = matcher.scan(text)
+        assert isinstance(found, dict)
+        assert {name: set(hits) for name, hits in found.items()} == expected(text)
@@ -0,0 +1,70 @@
+import json
+from datetime import datetime, timezone
+
+from shorts_scraper.store import VideoStore, import_json
+
+
+def _scraped_at(store, video_id):
+    return store.conn.execute(
+        "SELECT scraped_at FROM videos WHERE video_id = ?", (video_id,)
+    ).fetchone()[0]
+
+
+def test_import_keeps_scraped_at(tmp_path):
+    index_file = tmp_path / "index.json"
+    index_file.write_text(json.dumps({
+        "https://www.youtube.com/shorts/old1": {
+            "video_id": "youtube_old1", "scraped_at": "2024-01-01 12:00:00",
+            "title": "t", "uploader": "u", "channel": "c",
+        },
+        "https://www.youtube.com/shorts/old2": {
+            "video_id": "youtube_old2", "scraped_at": "2025-06-01T08:00:00+00:00",
+            "title": "t", "uploader": "u", "channel": "c",
+        },
+    }))
+    store = VideoStore(str(tmp_path / "videos.db"))
+    try:
+        assert import_json(store, index_file=str(index_file))["index"] == 2
+        local = datetime.fromisoformat("2024-01-01 12:00:00").astimezone(timezone.utc)
+        assert datetime.fromisoformat(_scraped_at(store, "old1")) == local
+        assert _scraped_at(store, "old2") == "2025-06-01T08:00:00+00:00"
+    finally:
+        store.close()
+
+
+def test_new_rows_use_iso_utc(tmp_path):
+    store = VideoStore(str(tmp_path / "videos.db"))
+    try:
+        store.add_video("https://www.youtube.com/shorts/new1", "youtube_new1")
+        scraped_at = datetime.fromisoformat(_scraped_at(store, "new1"))
+        assert scraped_at.utcoffset().total_seconds() == 0
+        stats = store.get_stats()
+        assert stats["oldest"] == stats["newest"] == _scraped_at(store, "new1")
+    finally:
+        store.close()
+
+
+def test_index_rows_get_no_default_label(tmp_path):
+    store = VideoStore(str(tmp_path / "videos.db"))
+    try:
+        store.add_video("https://www.youtube.com/shorts/s1", "youtube_s1")
+        store.add_video(
+            "https://www.youtube.com/shorts/s2", "youtube_s2",
+            {"label": "SCAM", "category": "Giveaway"},
+        )
+        rows = store.conn.execute(
+            "SELECT video_id, label, category FROM videos ORDER BY video_id"
+        ).fetchall()
+        assert rows == [("s1", None, None), ("s2", "SCAM", "Giveaway")]
+    finally:
+        store.close()
+
+
+def test_scraped_at_bounds_use_the_index(tmp_path):
+    store = VideoStore(str(tmp_path / "videos.db"))
+    try:
+        for query in ("SELECT MIN(scraped_at) FROM videos", "SELECT MAX(scraped_at) FROM videos"):
+            plan = store.conn.execute("EXPLAIN QUERY PLAN " + query).fetchall()
+            assert "idx_videos_scraped_at" in plan[0][3]
+    finally:
+        store.close()
@@ -0,0 +1,66 @@
+import json
+
+from shorts_scraper.tracker import DuplicateTracker
+
+SCRAPED_AT = {
+    "a": "2024-01-01 12:00:00",
+    "b": "2026-02-18T08:27:59.143879+00:00",
+    "c": "2023-05-06",
+    "d": "yesterday",
+    "e": "",
+    "f": None,
+}
+
+
+def test_scraped_at_round_trips_through_compaction(tmp_path):
+    index_file = tmp_path / "index.json"
+    index = {
+        f"https://www.youtube.com/shorts/{key}": {
+            "video_id": f"youtube_{key}", "scraped_at": value,
+            "title": "t", "uploader": "u", "channel": "c",
+        }
+        for key, value in SCRAPED_AT.items()
+    }
+    index_file.write_text(json.dumps(index))
+
+    tracker = DuplicateTracker(str(index_file))
+    tracker.add_video("https://www.youtube.com/shorts/new", "youtube_new")
+    tracker.compact()
+    tracker.close()
+
+    saved = json.loads(index_file.read_text())
+    for key, value in SCRAPED_AT.items():
+        assert saved[f"https://www.youtube.com/shorts/{key}"]["scraped_at"] == value
+
+    stats = DuplicateTracker(str(index_file)).get_stats()
+    assert stats["oldest"] == "2023-05-06"
+    assert stats["newest"] == saved["https://www.youtube.com/shorts/new"]["scraped_at"]
+
+
+def test_torn_journal_tail_is_dropped_and_truncated(tmp_path):
+    index_file = str(tmp_path / "index.json")
+    tracker = DuplicateTracker(index_file)
+    tracker.add_video("https://www.youtube.com/shorts/one", "youtube_one")
+    tracker.add_video("https://www.youtube.com/shorts/two", "youtube_two")
+    tracker.close()
+    journal = tmp_path / "index.json.journal"
+    intact = journal.read_bytes()
+    with open(journal, "ab") as f:
+        f.write(b'{"url": "https://www.youtube.com/shorts/thr')   # crash mid-append
+
+    tracker = DuplicateTracker(index_file)
+    assert tracker.is_duplicate("https://www.youtube.com/shorts/two")
+    assert not tracker.is_duplicate("https://www.youtube.com/shorts/three")
+    assert journal.read_bytes() == intact
+    tracker.add_video("https://www.youtube.com/shorts/four", "youtube_four")
+    tracker.close()
+    assert DuplicateTracker(index_file).is_duplicate("https://www.youtube.com/shorts/four")
+
+
+def test_close_does_not_rewrite_the_snapshot(tmp_path):
+    index_file = tmp_path / "index.json"
+    tracker = DuplicateTracker(str(index_file))
+    tracker.add_video("https://www.youtube.com/shorts/one", "youtube_one")
+    tracker.close()
+    assert not index_file.exists()
+    assert DuplicateTracker(str(index_file)).is_duplicate("https://www.youtube.com/shorts/one")